@@ -0,0 +1,163 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from driver_pool import DriverPool
+from search_cache import SearchCache
+from detail_cache import DetailCache
+from metrics import registry
+
+# 정렬 파라미터 → sort_by_price 옵션
+SORT_OPTIONS = {
+    'price': {},
+    'unit': {'by_unit': True},
+    'volume': {'by_volume': True},
+}
+
+
+class SearchService:
+    """동시 실행 수와 대기열 길이가 제한된 검색 서비스"""
+    
+    def __init__(self, workers=2, max_queue=8, timeout=90, pool=None, cache=None, detail_cache=None):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.pool = pool or DriverPool(size=workers, headless=True)
+        self.cache = cache or SearchCache(refresher=self._refresh)
+        self.detail_cache = detail_cache
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='api-search')
+        # 실행 중 + 대기 중인 요청 수
+        self._slots = threading.BoundedSemaphore(workers + max_queue)
+    
+    def _refresh(self, keyword, max_items):
+        with self.pool.lease(timeout=self.timeout) as scraper:
+            return scraper.search_products(keyword, max_items=max_items)
+    
+    def _search(self, keyword, max_items, sort, ascending, details):
+        # selenium은 실제로 브라우저가 필요할 때 import (서버 시작 시간 단축)
+        from st11_scraper import ST11Scraper
+        started = time.perf_counter()
+        # 브라우저는 캐시에 없어서 직접 검색하는 요청만 빌림 (캐시 적중/같은 검색 대기는 빌리지 않음)
+        start = 'warm' if self.pool.has_warm_idle() else 'cold'
+        products = self.cache.get_or_fetch(keyword, max_items, lambda: self._refresh(keyword, max_items))
+        registry.observe('search_first_result_seconds', time.perf_counter() - started, start=start)
+        products = ST11Scraper.sort_by_price(products, ascending=ascending, **SORT_OPTIONS[sort])
+        normal_products = [p for p in products if not p.get('is_ad')]
+        if details and normal_products:
+            with self.pool.lease(timeout=self.timeout) as scraper:
+                scraper.fetch_product_details(normal_products, max_count=details, cache=self.detail_cache)
+        return products
+    
+    def search(self, keyword, max_items=50, sort='price', ascending=True, details=0):
+        """검색 실행. 대기열이 꽉 차면 OverflowError, 시간 초과면 TimeoutError"""
+        if not self._slots.acquire(blocking=False):
+            raise OverflowError("대기열이 가득 찼습니다")
+        
+        try:
+            future = self._executor.submit(self._search, keyword, max_items, sort, ascending, details)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeout:
+            raise TimeoutError(f"{self.timeout}초 안에 검색이 끝나지 않았습니다")
+
+
+class SearchHandler(BaseHTTPRequestHandler):
+    """GET /search?kwd=...&max=...&sort=price|unit|volume&order=asc|desc&details=N"""
+    
+    service = None
+    
+    def do_GET(self):
+        url = urlparse(self.path)
+        
+        if url.path == '/health':
+            self._send_json(200, {'status': 'ok'})
+            return
+        if url.path == '/metrics':
+            data = registry.render_prometheus().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+            return
+        if url.path != '/search':
+            self._send_json(404, {'error': 'not found'})
+            return
+        
+        params = parse_qs(url.query)
+        keyword = params.get('kwd', [''])[0].strip()
+        sort = params.get('sort', ['price'])[0]
+        order = params.get('order', ['asc'])[0]
+        try:
+            max_items = int(params.get('max', ['50'])[0])
+            details = int(params.get('details', ['0'])[0])
+        except ValueError:
+            self._send_json(400, {'error': 'max, details는 정수여야 합니다'})
+            return
+        
+        if not keyword:
+            self._send_json(400, {'error': 'kwd 파라미터가 필요합니다'})
+            return
+        if sort not in SORT_OPTIONS or order not in ('asc', 'desc') or max_items <= 0 or details < 0:
+            self._send_json(400, {'error': '잘못된 파라미터입니다'})
+            return
+        
+        try:
+            products = self.service.search(keyword, max_items, sort, order == 'asc', details)
+        except OverflowError as e:
+            self._send_json(429, {'error': str(e)}, {'Retry-After': '5'})
+            return
+        except TimeoutError as e:
+            self._send_json(504, {'error': str(e)})
+            return
+        except Exception as e:
+            self._send_json(500, {'error': str(e)})
+            return
+        
+        self._send_json(200, {'keyword': keyword, 'count': len(products), 'products': products})
+    
+    def _send_json(self, status, body, headers=None):
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def main():
+    port = int(os.getenv('PORT', '8080'))
+    SearchHandler.service = SearchService(
+        workers=int(os.getenv('API_WORKERS', '2')),
+        max_queue=int(os.getenv('API_MAX_QUEUE', '8')),
+        timeout=int(os.getenv('API_TIMEOUT', '90')),
+        detail_cache=DetailCache(os.getenv('DETAIL_CACHE_PATH', 'detail_cache.sqlite3'))
+    )
+    # 설정되어 있으면 첫 요청 전에 브라우저를 미리 띄움
+    prewarm = int(os.getenv('PREWARM_BROWSERS', '0'))
+    if prewarm:
+        SearchHandler.service.pool.prewarm(prewarm)
+    
+    server = ThreadingHTTPServer(('0.0.0.0', port), SearchHandler)
+    print(f"🌐 검색 API 실행 중: http://localhost:{port}/search?kwd=...")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        SearchHandler.service.pool.close_all()
+
+
+if __name__ == "__main__":
+    main()
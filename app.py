@@ -1,9 +1,19 @@
 import streamlit as st
-from st11_scraper import ST11Scraper
-from telegram_bot import TelegramBot
+from driver_pool import DriverPool
+from detail_cache import DetailCache
+from search_cache import SearchCache
+from product_table import ProductTable
+from exporters import EXPORT_FORMATS, export_bytes
+from jobs import JobRunner, run_search
+from metrics import registry
+from dotenv import load_dotenv
+import os
 import time
 import webbrowser
 
+# selenium/requests는 처음 필요할 때 import (첫 화면을 빨리 띄우기 위해)
+load_dotenv()
+
 # 페이지 설정
 st.set_page_config(
     page_title="🛒 11번가 쇼핑 검색",
@@ -11,6 +21,169 @@ st.set_page_config(
     layout="wide"
 )
 
+@st.cache_resource
+def get_driver_pool():
+    """모든 세션/리런이 공유하는 헤드리스 브라우저 풀"""
+    pool_size = int(os.getenv('DRIVER_POOL_SIZE', '2'))
+    pool = DriverPool(size=pool_size, headless=True)
+    # PREWARM_BROWSERS개를 백그라운드에서 미리 띄워 첫 검색의 브라우저 시작 대기를 없앰
+    prewarm = int(os.getenv('PREWARM_BROWSERS', '0'))
+    if prewarm:
+        pool.prewarm(prewarm)
+    return pool
+
+@st.cache_resource
+def get_detail_cache():
+    """상세 정보 디스크 캐시 (프로세스 전체 공유)"""
+    return DetailCache(os.getenv('DETAIL_CACHE_PATH', 'detail_cache.sqlite3'))
+
+@st.cache_resource
+def get_search_cache():
+    """세션 간 공유되는 검색 결과 캐시 (오래된 결과는 풀 브라우저로 백그라운드 갱신)"""
+    pool = get_driver_pool()
+    
+    def refresh(keyword, max_items):
+        with pool.lease(timeout=120) as scraper:
+            return scraper.search_products(keyword, max_items=max_items)
+    
+    return SearchCache(
+        ttl=int(os.getenv('SEARCH_CACHE_TTL', '300')),
+        stale_ttl=int(os.getenv('SEARCH_CACHE_STALE_TTL', '1800')),
+        refresher=refresh
+    )
+
+@st.cache_resource
+def get_telegram_bot():
+    """프로세스 전체가 공유하는 텔레그램 봇 (연결/전송 한도 공유)"""
+    from telegram_bot import TelegramBot
+    return TelegramBot()
+
+@st.cache_resource
+def get_job_runner():
+    """서버 전체가 공유하는 검색 작업 실행기 (동시 브라우저 작업 수 제한)"""
+    max_jobs = int(os.getenv('MAX_BROWSER_JOBS', os.getenv('DRIVER_POOL_SIZE', '2')))
+    return JobRunner(max_jobs=max_jobs)
+
+def sort_table(table, sort_option):
+    """사이드바 정렬 방식에 맞춰 결과 테이블 정렬"""
+    if "개당 가격" in sort_option:
+        column = 'unit_price'
+    elif "용량당 가격" in sort_option:
+        column = 'price_per_100'
+    else:
+        column = 'price'
+    return table.sort(column, ascending="낮은 순" in sort_option)
+
+def cached_export(data, kind, products, export_format, sort_option, group_same, **kwargs):
+    """다운로드 파일 내용을 결과마다 한 번만 만들어 세션에 보관 (페이지 이동/상품 선택 rerun마다 다시 직렬화하지 않음)"""
+    exports = data.setdefault('exports', {})
+    key = (kind, export_format, sort_option, group_same)
+    if key not in exports:
+        exports[key] = export_bytes(products, export_format, **kwargs)
+    return exports[key]
+
+def render_product_detail(product, is_ad=False):
+    """선택한 상품 하나의 상세 정보 표시"""
+    col1, col2 = st.columns([3, 1])
+    
+    with col1:
+        # 가격 정보
+        if product['quantity'] > 1:
+            st.write(f"💰 **총 가격:** {product['price']:,}원")
+            st.write(f"📦 **개당 가격:** 약 {int(product['unit_price']):,}원 (x{product['quantity']}개)")
+        else:
+            st.write(f"💰 **가격:** {product['price']:,}원")
+        
+        if product.get('price_per_100') is not None:
+            st.write(f"📏 **100{product['unit_type']}당:** 약 {int(product['price_per_100']):,}원")
+        
+        st.write(f"🚚 **배송:** {product['delivery']}")
+        
+        if (product.get('offer_count') or 1) > 1:
+            st.write(f"🏪 **판매처:** {product['offer_count']}곳 중 최저가")
+        
+        if is_ad:
+            st.write("🔴 **광고 상품**")
+        
+        # 별점/리뷰
+        if product.get('rating') is not None:
+            stars = "⭐" * int(product['rating'])
+            st.write(f"⭐ **별점:** {product['rating']:.1f} {stars}")
+        
+        if product.get('review_count') is not None:
+            st.write(f"💬 **리뷰:** {product['review_count']:,}개")
+        
+        # 판매자 정보
+        if product.get('seller_satisfaction'):
+            st.write(f"👍 **판매자 만족:** {product['seller_satisfaction']}")
+        if product.get('seller_response'):
+            st.write(f"⚡ **응답률:** {product['seller_response']}")
+        if product.get('seller_sales'):
+            st.write(f"📊 **판매량:** {product['seller_sales']}")
+    
+    with col2:
+        st.link_button("🔗 상품 보기", product['link'], use_container_width=True)
+        
+        # 리뷰 보기 버튼
+        if product.get('review_count') and product['review_count'] > 0:
+            review_url = f"{product['link']}#review"
+            st.link_button("💬 리뷰 보기", review_url, use_container_width=True)
+
+def render_product_page(table, key, is_ad=False):
+    """결과를 페이지 단위 표 하나로 그리고, 고른 상품만 상세 표시 (결과 수와 무관하게 리런 시간 일정)"""
+    col1, col2 = st.columns([1, 1])
+    with col1:
+        page_size = st.selectbox("페이지 크기", [20, 50, 100, 200], key=f"{key}_page_size")
+    total_pages = max(1, (len(table) + page_size - 1) // page_size)
+    with col2:
+        page = st.number_input(f"페이지 (총 {total_pages})", 1, total_pages, 1, key=f"{key}_page")
+    
+    start = (page - 1) * page_size
+    page_table = table.take(range(start, min(start + page_size, len(table))))
+    
+    rows = []
+    for offset, product in enumerate(page_table):
+        rows.append({
+            '순위': start + offset + 1,
+            '상품명': product['name'],
+            '가격': product['price'],
+            '개당 가격': int(product['unit_price']),
+            '100단위 가격': int(product['price_per_100']) if product['price_per_100'] is not None else None,
+            '배송': product['delivery'],
+            '별점': product['rating'],
+            '리뷰': product['review_count'],
+            '링크': product['link']
+        })
+        if product['offer_count'] is not None:
+            rows[-1]['판매처'] = product['offer_count']
+    
+    st.dataframe(
+        rows,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            '가격': st.column_config.NumberColumn(format="%d원"),
+            '개당 가격': st.column_config.NumberColumn(format="%d원"),
+            '100단위 가격': st.column_config.NumberColumn(format="%d원", help="100ml / 100g / 100매 기준"),
+            '링크': st.column_config.LinkColumn(display_text="상품 보기")
+        }
+    )
+    
+    # 상세 정보는 선택한 상품 하나만 렌더링
+    selected = st.selectbox(
+        "🔎 상세 보기",
+        range(len(page_table)),
+        index=None,
+        format_func=lambda i: f"{start + i + 1}. {page_table.column('name')[i][:80]}",
+        placeholder="상품을 선택하세요",
+        key=f"{key}_detail_{page}"
+    )
+    if selected is not None:
+        render_product_detail(page_table.row(selected), is_ad=is_ad)
+
+# 브라우저 풀은 첫 접속 때 만들어 둠 (PREWARM_BROWSERS 설정 시 화면을 보는 동안 예열)
+get_driver_pool()
+
 # 타이틀
 st.title("🛒 11번가 쇼핑 검색")
 st.markdown("---")
@@ -39,16 +212,28 @@ else:
 # 정렬 방식
 sort_option = st.sidebar.radio(
     "정렬 방식",
-    options=["총 가격 낮은 순", "총 가격 높은 순", "개당 가격 낮은 순", "개당 가격 높은 순"]
+    options=["총 가격 낮은 순", "총 가격 높은 순", "개당 가격 낮은 순", "개당 가격 높은 순", "용량당 가격 낮은 순", "용량당 가격 높은 순"]
 )
 
 # 상세 정보 수집
 fetch_details = st.sidebar.checkbox(
-    "⭐ 상위 20개 상세 정보 수집",
+    "⭐ 상세 정보 수집",
     value=False,
     help="별점, 리뷰, 판매자 정보 (시간이 더 걸립니다)"
 )
 
+if fetch_details:
+    detail_count = st.sidebar.slider("상세 정보 수집 개수", 10, 300, 20, 10)
+else:
+    detail_count = 0
+
+# 같은 상품 묶기
+group_same = st.sidebar.checkbox(
+    "🧩 같은 상품 묶기 (최저가만 표시)",
+    value=False,
+    help="판매처만 다르고 이름과 개수/용량이 같은 상품은 가장 싼 것 하나만 보여줍니다"
+)
+
 # 텔레그램 전송
 send_telegram = st.sidebar.checkbox("텔레그램으로 결과 전송")
 
@@ -57,10 +242,28 @@ show_browser = st.sidebar.checkbox("브라우저 보이기", value=False)
 
 st.sidebar.markdown("---")
 
+# 성능 지표 요약 (단계별 평균 시간, 실패 횟수)
+with st.sidebar.expander("📈 성능 지표"):
+    metric_rows = registry.summary()
+    if metric_rows:
+        st.dataframe(
+            [{'지표': name + labels, '횟수': count, '평균(초)': round(avg, 3) if avg is not None else None}
+             for name, labels, count, avg in metric_rows],
+            use_container_width=True,
+            hide_index=True
+        )
+        st.download_button("📥 Prometheus 형식", registry.render_prometheus(), "metrics.prom")
+    else:
+        st.caption("아직 기록된 지표가 없습니다.")
+
 # 세션 스테이트 초기화
 if 'search_results' not in st.session_state:
     st.session_state.search_results = None
 
+if 'job_id' not in st.session_state:
+    # 탭을 닫았다 다시 열어도 URL의 job id로 진행 중인 검색에 다시 연결
+    st.session_state.job_id = st.query_params.get('job')
+
 # 검색 버튼
 if st.sidebar.button("🔍 검색 시작", type="primary", use_container_width=True):
     if not keywords_input:
@@ -68,137 +271,88 @@ if st.sidebar.button("🔍 검색 시작", type="primary", use_container_width=T
     else:
         search_keywords = [k.strip() for k in keywords_input.split(',') if k.strip()]
         
-        progress_bar = st.progress(0)
-        status_text = st.empty()
+        job = get_job_runner().submit(
+            run_search,
+            {
+                'keywords': search_keywords,
+                'max_items': max_items,
+                'sort_option': sort_option,
+                'detail_count': detail_count,
+                'send_telegram': send_telegram,
+                'show_browser': show_browser,
+                'workers': int(os.getenv('SEARCH_WORKERS', '2'))
+            },
+            pool=get_driver_pool(),
+            search_cache=get_search_cache(),
+            detail_cache=get_detail_cache(),
+            telegram=get_telegram_bot() if send_telegram else None,
+            name=', '.join(search_keywords),
+            meta={'keywords': search_keywords}
+        )
+        st.session_state.job_id = job.id
+        st.query_params['job'] = job.id
+        st.rerun()
+
+# 진행 중인 검색 작업 표시 (1초마다 폴링)
+if st.session_state.job_id:
+    runner = get_job_runner()
+    job = runner.get(st.session_state.job_id)
+    
+    if job is None:
+        st.warning("⚠️ 검색 작업을 찾을 수 없습니다 (만료되었거나 서버가 재시작됨)")
+        st.session_state.job_id = None
+        st.query_params.clear()
+    elif not job.done:
+        st.caption(f"🆔 작업 {job.id} · {job.name}")
+        st.progress(job.progress)
+        if job.state == 'queued':
+            st.text(f"⏳ 대기 중... (앞에 {runner.queue_position(job)}개 작업)")
+        else:
+            st.text(job.status)
         
-        try:
-            status_text.text("🚀 크롤러 초기화 중...")
-            scraper = ST11Scraper(headless=not show_browser)
-            progress_bar.progress(10)
-            
-            all_results = []
-            
-            # 각 키워드 검색
-            for idx, keyword in enumerate(search_keywords):
-                status_text.text(f"🔍 '{keyword}' 검색 중... ({idx+1}/{len(search_keywords)})")
-                products = scraper.search_products(keyword, max_items=max_items)
-                
-                if products:
-                    all_results.extend(products)
-                
-                progress_bar.progress(10 + int(50 * (idx + 1) / len(search_keywords)))
-                time.sleep(1)
-            
-            # 중복 제거
-            status_text.text("🔄 중복 제거 중...")
-            seen_links = set()
-            unique_results = []
-            for product in all_results:
-                if product['link'] not in seen_links:
-                    seen_links.add(product['link'])
-                    unique_results.append(product)
-            
-            progress_bar.progress(65)
-            
-            # 정렬
-            status_text.text("📊 정렬 중...")
-            sort_by_unit = "개당 가격" in sort_option
-            ascending = "낮은 순" in sort_option
-            unique_results = scraper.sort_by_price(unique_results, ascending=ascending, by_unit=sort_by_unit)
-            
-            progress_bar.progress(75)
-            
-            # 상세 정보 수집
-            if fetch_details:
-                status_text.text("⭐ 상위 20개 상품의 상세 정보 수집 중...")
-                normal_products = [p for p in unique_results if not p.get('is_ad')]
-                if normal_products:
-                    scraper.fetch_product_details(normal_products, max_count=20)
-                progress_bar.progress(85)
-            
-            # 텔레그램 전송
-            if send_telegram and unique_results:
-                status_text.text("📤 텔레그램 전송 중...")
-                try:
-                    telegram = TelegramBot()
-                    
-                    normal_products = [p for p in unique_results if not p.get('is_ad')]
-                    ad_products = [p for p in unique_results if p.get('is_ad')]
-                    
-                    # 일반 상품 전송
-                    if normal_products:
-                        message = f"🛒 <b>11번가 검색 결과 (일반 상품)</b>\n"
-                        message += f"검색어: {', '.join(search_keywords)}\n"
-                        message += f"정렬: {sort_option}\n"
-                        message += f"총 {len(normal_products)}개\n"
-                        message += "=" * 40 + "\n\n"
-                        
-                        for idx, product in enumerate(normal_products[:15], 1):
-                            message += scraper.format_product_info(product, idx)
-                            message += "-" * 40 + "\n"
-                        
-                        if len(message) > 4000:
-                            parts = [message[i:i+4000] for i in range(0, len(message), 4000)]
-                            for part in parts:
-                                telegram.send_message(part)
-                                time.sleep(1)
-                        else:
-                            telegram.send_message(message)
-                    
-                    # 광고 상품 전송
-                    if ad_products:
-                        time.sleep(2)
-                        message = f"🔴 <b>11번가 검색 결과 (광고 상품)</b>\n"
-                        message += f"검색어: {', '.join(search_keywords)}\n"
-                        message += f"총 {len(ad_products)}개\n"
-                        message += "=" * 40 + "\n\n"
-                        
-                        for idx, product in enumerate(ad_products[:15], 1):
-                            message += scraper.format_product_info(product, idx)
-                            message += "-" * 40 + "\n"
-                        
-                        if len(message) > 4000:
-                            parts = [message[i:i+4000] for i in range(0, len(message), 4000)]
-                            for part in parts:
-                                telegram.send_message(part)
-                                time.sleep(1)
-                        else:
-                            telegram.send_message(message)
-                    
-                    st.sidebar.success("✅ 텔레그램 전송 완료!")
-                except Exception as e:
-                    st.sidebar.error(f"❌ 텔레그램 전송 실패: {e}")
-            
-            progress_bar.progress(100)
-            status_text.text("✅ 검색 완료!")
-            
-            scraper.close()
+        # 스크롤로 새 상품이 들어오는 대로 미리보기 갱신
+        preview = job.snapshot_preview()
+        if preview:
+            st.dataframe(
+                [{'상품명': p['name'], '가격': p['price'], '배송': p['delivery'], '키워드': kw}
+                 for kw, p in preview],
+                use_container_width=True,
+                hide_index=True
+            )
+        
+        time.sleep(1)
+        st.rerun()
+    else:
+        if job.state == 'done':
+            # 세션에는 컬럼형 테이블로 보관 (정렬 변경 시 재검색 없이 다시 정렬)
             st.session_state.search_results = {
-                'products': unique_results,
-                'keywords': search_keywords,
-                'sort_option': sort_option
+                'products': ProductTable.from_dicts(job.result),
+                'keywords': job.meta['keywords']
             }
-            
-            time.sleep(1)
-            progress_bar.empty()
-            status_text.empty()
-            
-            st.rerun()
-            
-        except Exception as e:
-            st.error(f"❌ 에러 발생: {e}")
-            import traceback
-            st.code(traceback.format_exc())
+            for note in job.notes:
+                st.sidebar.info(note)
+        else:
+            st.error(job.status)
+            st.code(job.error)
+        st.session_state.job_id = None
+        st.query_params.clear()
 
 # 결과 표시
 if st.session_state.search_results:
     data = st.session_state.search_results
-    unique_results = data['products']
     search_keywords = data['keywords']
-    sort_option = data['sort_option']
     
-    normal_products = [p for p in unique_results if not p.get('is_ad')]
-    ad_products = [p for p in unique_results if p.get('is_ad')]
+    # 같은 상품 묶기는 검색 결과마다 한 번만 계산해 두고 재사용
+    table = data['products']
+    if group_same:
+        if data.get('grouped') is None:
+            data['grouped'] = table.cheapest_offers()
+        st.info(f"🧩 {len(table)}개 판매 상품 → {len(data['grouped'])}개 상품으로 묶음 (그룹마다 최저가)")
+        table = data['grouped']
+    
+    # 사이드바 정렬 방식이 바뀌면 저장된 테이블만 다시 정렬
+    unique_results = sort_table(table, sort_option)
+    normal_products, ad_products = unique_results.split_ads()
     
     st.success(f"🎉 총 {len(unique_results)}개 제품 (일반 {len(normal_products)}개 + 광고 {len(ad_products)}개)")
     
@@ -209,10 +363,10 @@ if st.session_state.search_results:
     with col2:
         st.metric("광고 상품", f"{len(ad_products)}개")
     with col3:
-        avg_price = sum(p['price'] for p in normal_products) / len(normal_products) if normal_products else 0
+        avg_price = normal_products.mean('price')
         st.metric("평균 가격", f"{int(avg_price):,}원")
     with col4:
-        free_delivery = sum(1 for p in unique_results if '무료' in p['delivery'])
+        free_delivery = unique_results.count('delivery', lambda d: '무료' in d)
         st.metric("무료배송", f"{free_delivery}개")
     
     st.markdown("---")
@@ -223,120 +377,40 @@ if st.session_state.search_results:
     with tab1:
         if normal_products:
             st.info(f"ℹ️ {sort_option}")
-            
-            for idx, product in enumerate(normal_products, 1):
-                with st.expander(f"**{idx}. {product['name'][:80]}...**"):
-                    col1, col2 = st.columns([3, 1])
-                    
-                    with col1:
-                        # 가격 정보
-                        if product['quantity'] > 1:
-                            st.write(f"💰 **총 가격:** {product['price']:,}원")
-                            st.write(f"📦 **개당 가격:** 약 {int(product['unit_price']):,}원 (x{product['quantity']}개)")
-                        else:
-                            st.write(f"💰 **가격:** {product['price']:,}원")
-                        
-                        st.write(f"🚚 **배송:** {product['delivery']}")
-                        
-                        # 별점/리뷰
-                        if product.get('rating') is not None:
-                            stars = "⭐" * int(product['rating'])
-                            st.write(f"⭐ **별점:** {product['rating']:.1f} {stars}")
-                        
-                        if product.get('review_count') is not None:
-                            st.write(f"💬 **리뷰:** {product['review_count']:,}개")
-                        
-                        # 판매자 정보
-                        if product.get('seller_satisfaction'):
-                            st.write(f"👍 **판매자 만족:** {product['seller_satisfaction']}")
-                        if product.get('seller_response'):
-                            st.write(f"⚡ **응답률:** {product['seller_response']}")
-                        if product.get('seller_sales'):
-                            st.write(f"📊 **판매량:** {product['seller_sales']}")
-                    
-                    with col2:
-                        st.link_button("🔗 상품 보기", product['link'], use_container_width=True)
-                        
-                        # 리뷰 보기 버튼
-                        if product.get('review_count') and product['review_count'] > 0:
-                            review_url = f"{product['link']}#review"
-                            st.link_button("💬 리뷰 보기", review_url, use_container_width=True)
+            render_product_page(normal_products, "normal")
         else:
             st.warning("일반 상품이 없습니다.")
     
     with tab2:
         if ad_products:
             st.warning(f"⚠️ 광고 상품 {len(ad_products)}개")
-            
-            for idx, product in enumerate(ad_products, 1):
-                with st.expander(f"**{idx}. 🔴 {product['name'][:80]}...**"):
-                    col1, col2 = st.columns([3, 1])
-                    
-                    with col1:
-                        if product['quantity'] > 1:
-                            st.write(f"💰 **총 가격:** {product['price']:,}원")
-                            st.write(f"📦 **개당 가격:** 약 {int(product['unit_price']):,}원")
-                        else:
-                            st.write(f"💰 **가격:** {product['price']:,}원")
-                        
-                        st.write(f"🚚 **배송:** {product['delivery']}")
-                        st.write("🔴 **광고 상품**")
-                    
-                    with col2:
-                        st.link_button("🔗 상품 보기", product['link'], use_container_width=True)
+            render_product_page(ad_products, "ads", is_ad=True)
         else:
             st.info("광고 상품이 없습니다.")
     
     # 다운로드
     st.markdown("---")
+    export_format = st.radio("📄 다운로드 형식", list(EXPORT_FORMATS), horizontal=True)
     col1, col2 = st.columns(2)
     
     with col1:
         if normal_products:
-            txt = f"11번가 검색 결과 (일반 상품)\n{'='*70}\n\n"
-            txt += f"검색어: {', '.join(search_keywords)}\n"
-            txt += f"정렬: {sort_option}\n\n"
-            
-            for idx, p in enumerate(normal_products, 1):
-                txt += f"{idx}. {p['name']}\n"
-                txt += f"   가격: {p['price']:,}원\n"
-                if p['quantity'] > 1:
-                    txt += f"   개당: {int(p['unit_price']):,}원 ({p['quantity']}개)\n"
-                txt += f"   배송: {p['delivery']}\n"
-                if p.get('rating'):
-                    txt += f"   별점: {p['rating']:.1f}\n"
-                if p.get('review_count'):
-                    txt += f"   리뷰: {p['review_count']:,}개\n"
-                if p.get('seller_satisfaction'):
-                    txt += f"   판매자 만족: {p['seller_satisfaction']}\n"
-                if p.get('seller_response'):
-                    txt += f"   응답률: {p['seller_response']}\n"
-                if p.get('seller_sales'):
-                    txt += f"   판매량: {p['seller_sales']}\n"
-                txt += f"   링크: {p['link']}\n\n"
-            
             st.download_button(
                 "📥 일반 상품 다운로드",
-                txt,
-                f"11st_normal_{int(time.time())}.txt",
+                cached_export(data, 'normal', normal_products, export_format, sort_option, group_same,
+                              title="11번가 검색 결과 (일반 상품)", keywords=search_keywords, sort_text=sort_option),
+                f"11st_normal_{int(time.time())}.{export_format}",
+                mime=EXPORT_FORMATS[export_format],
                 use_container_width=True
             )
     
     with col2:
         if ad_products:
-            txt = f"11번가 검색 결과 (광고 상품)\n{'='*70}\n\n"
-            txt += f"검색어: {', '.join(search_keywords)}\n\n"
-            
-            for idx, p in enumerate(ad_products, 1):
-                txt += f"{idx}. {p['name']}\n"
-                txt += f"   가격: {p['price']:,}원\n"
-                txt += f"   배송: {p['delivery']}\n"
-                txt += f"   링크: {p['link']}\n"
-                txt += f"   [광고]\n\n"
-            
             st.download_button(
                 "📥 광고 상품 다운로드",
-                txt,
-                f"11st_ads_{int(time.time())}.txt",
+                cached_export(data, 'ads', ad_products, export_format, sort_option, group_same,
+                              title="11번가 검색 결과 (광고 상품)", keywords=search_keywords),
+                f"11st_ads_{int(time.time())}.{export_format}",
+                mime=EXPORT_FORMATS[export_format],
                 use_container_width=True
-            )
\ No newline at end of file
+            )
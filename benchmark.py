@@ -0,0 +1,149 @@
+import html
+import os
+import re
+import statistics
+import time
+from replay_server import start_replay_server, use_replay_urls, synthetic_search_page
+
+# 카탈로그 크기 (검색 결과 상품 수)
+SIZES = [int(s) for s in os.getenv('BENCH_SIZES', '50,200,1000').split(',')]
+REPEATS = int(os.getenv('BENCH_REPEATS', '5'))
+LATENCY = float(os.getenv('REPLAY_LATENCY', '0.05'))
+PAGE_TABS = int(os.getenv('BENCH_PAGE_TABS', '4'))
+DETAIL_TABS = int(os.getenv('BENCH_DETAIL_TABS', '4'))
+
+LOG_BODY_RE = re.compile(r'data-log-body="([^"]*)"[^>]*><span class="sr-only">([^<]*)</span>')
+
+
+def measure(fn, repeats=REPEATS):
+    """fn을 repeats번 실행해 (p50, p95, 결과) 반환"""
+    timings = []
+    result = None
+    for _ in range(repeats):
+        started = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    p95 = timings[min(len(timings) - 1, int(round(0.95 * (len(timings) - 1))))]
+    return statistics.median(timings), p95, result
+
+
+def report(name, size, items, p50, p95):
+    throughput = items / p50 if p50 else float('inf')
+    print(f"{name:<32} {size:>6} {p50 * 1000:>10.2f} {p95 * 1000:>10.2f} {throughput:>12.0f}")
+
+
+def synthetic_cards(size):
+    """대역 서버와 같은 카드 payload (data-log-body, 상품명)"""
+    page = synthetic_search_page(size)
+    return [(html.unescape(body), html.unescape(name)) for body, name in LOG_BODY_RE.findall(page)]
+
+
+def bench_parsing():
+    """브라우저 없이 카드 파싱과 수량 파싱 측정"""
+    from st11_scraper import ST11Scraper
+    from quantity_parser import parse_quantities, apply_quantities
+    from offer_groups import cheapest_offers
+    
+    scraper_cls = ST11Scraper
+    for size in SIZES:
+        cards = synthetic_cards(size)
+        names = [name for _, name in cards]
+        
+        p50, p95, _ = measure(lambda: [scraper_cls._parse_card(body, name) for body, name in cards])
+        report("_parse_card (data-log-body)", size, size, p50, p95)
+        
+        p50, p95, _ = measure(lambda: [parse_quantities([name])[0]['count'] for name in names])
+        report("_extract_quantity (per name)", size, size, p50, p95)
+        
+        p50, p95, _ = measure(lambda: parse_quantities(names))
+        report("parse_quantities (batch)", size, size, p50, p95)
+        
+        products = apply_quantities([scraper_cls._parse_card(body, name) for body, name in cards])
+        p50, p95, _ = measure(lambda: cheapest_offers(products))
+        report("cheapest_offers (MinHash LSH)", size, size, p50, p95)
+
+
+def bench_http_details(base_url):
+    """HTTP 상세 수집기 측정 (대역 서버 사용)"""
+    from detail_fetcher import HttpDetailFetcher
+    
+    for size in SIZES:
+        urls = [f"{base_url}/products/{900000000 + i}" for i in range(min(size, 200))]
+        fetcher = HttpDetailFetcher()
+        try:
+            p50, p95, _ = measure(lambda: fetcher.fetch_many(urls), repeats=max(1, REPEATS // 2))
+        finally:
+            fetcher.close()
+        report("HttpDetailFetcher.fetch_many", size, len(urls), p50, p95)
+
+
+def bench_browser():
+    """실제 브라우저로 search_products / fetch_product_details / 전체 흐름 측정"""
+    from st11_scraper import ST11Scraper
+    
+    try:
+        scraper = ST11Scraper(headless=True, page_tabs=0, detail_tabs=1)
+    except Exception as e:
+        print(f"(브라우저 벤치마크 생략: {e})")
+        return
+    
+    try:
+        for size in SIZES:
+            keyword = f"synthetic-{size}"
+            p50, p95, products = measure(lambda: scraper.search_products(keyword, max_items=size),
+                                         repeats=max(1, REPEATS // 2))
+            report("search_products", size, len(products), p50, p95)
+            
+            scraper.page_tabs = PAGE_TABS
+            try:
+                p50, p95, products = measure(lambda: scraper.search_products(keyword, max_items=size),
+                                             repeats=max(1, REPEATS // 2))
+            finally:
+                scraper.page_tabs = 0
+            report(f"search_products (pages x{PAGE_TABS})", size, len(products), p50, p95)
+            
+            targets = [dict(p) for p in products[:20]]
+            p50, p95, _ = measure(lambda: scraper.fetch_product_details(targets, max_count=20, use_http=False),
+                                  repeats=1)
+            report("fetch_product_details (browser)", size, len(targets), p50, p95)
+            
+            scraper.detail_tabs = DETAIL_TABS
+            try:
+                targets = [dict(p) for p in products[:20]]
+                p50, p95, _ = measure(lambda: scraper.fetch_product_details(targets, max_count=20, use_http=False),
+                                      repeats=1)
+            finally:
+                scraper.detail_tabs = 1
+            report(f"fetch_product_details (tabs x{DETAIL_TABS})", size, len(targets), p50, p95)
+            
+            def end_to_end():
+                found = scraper.search_products(keyword, max_items=size)
+                found = scraper.sort_by_price(found, by_unit=True)
+                scraper.fetch_product_details([p for p in found if not p['is_ad']], max_count=20)
+                return found
+            
+            p50, p95, found = measure(end_to_end, repeats=1)
+            report("end-to-end (search+details)", size, len(found), p50, p95)
+    finally:
+        scraper.close()
+
+
+def main():
+    server, base_url = start_replay_server(latency=LATENCY)
+    use_replay_urls(base_url)
+    print(f"🎞️  대역 서버 {base_url} (지연 {LATENCY * 1000:.0f}ms), 반복 {REPEATS}회\n")
+    print(f"{'benchmark':<32} {'size':>6} {'p50(ms)':>10} {'p95(ms)':>10} {'items/s':>12}")
+    print("-" * 74)
+    
+    try:
+        bench_parsing()
+        bench_http_details(base_url)
+        if os.getenv('BENCH_BROWSER', '1') == '1':
+            bench_browser()
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
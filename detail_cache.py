@@ -0,0 +1,125 @@
+import json
+import sqlite3
+import threading
+import time
+
+# 필드별 캐시 유효 시간 (초)
+DEFAULT_FIELD_TTL = {
+    'rating': 24 * 3600,
+    'review_count': 6 * 3600,
+    'seller_satisfaction': 3 * 24 * 3600,
+    'seller_response': 3 * 24 * 3600,
+    'seller_sales': 3 * 24 * 3600,
+}
+
+
+class DetailCache:
+    """content_no 기준 상세 정보 디스크 캐시 (SQLite)"""
+    
+    def __init__(self, path='detail_cache.sqlite3', field_ttl=None, max_products=5000):
+        self.path = path
+        self.field_ttl = {**DEFAULT_FIELD_TTL, **(field_ttl or {})}
+        self.max_products = max_products
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS details (
+                content_no TEXT NOT NULL,
+                field TEXT NOT NULL,
+                value TEXT,
+                updated_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (content_no, field)
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_details_accessed ON details (accessed_at)")
+        self._conn.commit()
+    
+    def fill(self, product):
+        """유효한 캐시 필드를 상품에 채우고 채운 필드 이름 집합 반환
+        
+        모든 필드가 신선하면 hit로 센다 (is_complete로 확인).
+        """
+        content_no = product.get('content_no')
+        if not content_no:
+            self.misses += 1
+            return set()
+        
+        now = time.time()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT field, value, updated_at FROM details WHERE content_no = ?",
+                (content_no,)
+            ).fetchall()
+            if rows:
+                self._conn.execute(
+                    "UPDATE details SET accessed_at = ? WHERE content_no = ?",
+                    (now, content_no)
+                )
+                self._conn.commit()
+        
+        fresh = set()
+        for field, value, updated_at in rows:
+            ttl = self.field_ttl.get(field)
+            if ttl is None or now - updated_at > ttl:
+                continue
+            product[field] = json.loads(value)
+            fresh.add(field)
+        
+        if self.is_complete(fresh):
+            self.hits += 1
+        else:
+            self.misses += 1
+        return fresh
+    
+    def is_complete(self, fields):
+        """fill이 돌려준 필드로 모든 상세 필드가 채워졌는지"""
+        return set(fields).issuperset(self.field_ttl)
+    
+    def store(self, product):
+        """상품의 상세 필드를 모두 캐시에 저장 (값이 없는 필드는 null로 저장해 "없음"도 캐시)
+        
+        product에는 이번에 새로 가져온 필드만 담아야 하고, 수집에 실패한 상품은 저장하지 않는다.
+        캐시에서 채운 필드를 다시 저장하면 updated_at이 갱신되어 필드별 유효 시간이 무의미해진다.
+        """
+        content_no = product.get('content_no')
+        if not content_no:
+            return
+        
+        now = time.time()
+        rows = [
+            (content_no, field, json.dumps(product.get(field)), now, now)
+            for field in self.field_ttl
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO details VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            self._evict()
+            self._conn.commit()
+    
+    def _evict(self):
+        """max_products를 넘으면 가장 오래 안 쓰인 상품부터 삭제"""
+        count = self._conn.execute("SELECT COUNT(DISTINCT content_no) FROM details").fetchone()[0]
+        overflow = count - self.max_products
+        if overflow <= 0:
+            return
+        self._conn.execute("""
+            DELETE FROM details WHERE content_no IN (
+                SELECT content_no FROM details
+                GROUP BY content_no
+                ORDER BY MAX(accessed_at)
+                LIMIT ?
+            )
+        """, (overflow,))
+    
+    def stats(self):
+        """캐시 적중/실패 횟수"""
+        return {'hits': self.hits, 'misses': self.misses}
+    
+    def close(self):
+        """DB 연결 종료"""
+        self._conn.close()
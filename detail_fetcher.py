@@ -0,0 +1,75 @@
+import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from lxml import html as lxml_html
+from metrics import registry
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+
+def parse_detail_html(content):
+    """상세 페이지 HTML에서 DETAIL_EXTRACT_JS와 같은 형태의 필드 추출"""
+    doc = lxml_html.fromstring(content)
+    
+    def first_text(xpath):
+        found = doc.xpath(xpath)
+        return found[0].text_content() if found else None
+    
+    descriptions = doc.xpath("//meta[@name='description']/@content")
+    
+    seller = []
+    for dt in doc.xpath("//dl[contains(concat(' ', normalize-space(@class), ' '), ' info_cont ')]//dt"):
+        dd_list = dt.xpath("./following-sibling::dd[1]")
+        dd = dd_list[0] if dd_list else None
+        score = dd.xpath(".//em[contains(@class, 'score')]/@class") if dd is not None else []
+        seller.append({
+            'label': dt.text_content(),
+            'value': dd.text_content().strip() if dd is not None else None,
+            'score_class': score[0] if score else None
+        })
+    
+    return {
+        'description': descriptions[0] if descriptions else None,
+        'review_star': first_text("//*[@id='prdReviewStar']"),
+        'review_num': first_text("//strong[contains(concat(' ', normalize-space(@class), ' '), ' text_num ')]"),
+        'seller': seller
+    }
+
+
+class HttpDetailFetcher:
+    """브라우저 없이 상세 페이지를 동시에 가져오는 HTTP 수집기"""
+    
+    def __init__(self, concurrency=8, timeout=10):
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=concurrency, pool_maxsize=concurrency, max_retries=1)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'User-Agent': USER_AGENT,
+            'Accept-Language': 'ko-KR,ko;q=0.9'
+        })
+    
+    def fetch_fields(self, url):
+        """상세 페이지 1개를 받아 필드 추출 (실패 시 None)"""
+        try:
+            with registry.timer('scraper_detail_seconds', mode='http'):
+                response = self.session.get(url, timeout=self.timeout)
+                response.raise_for_status()
+                return parse_detail_html(response.content)
+        except Exception as e:
+            print(f"      ⚠️  HTTP 수집 실패: {str(e)[:50]}")
+            registry.inc('scraper_detail_failures_total', mode='http')
+            return None
+    
+    def fetch_many(self, urls):
+        """여러 상세 페이지를 동시에 가져와 url 순서대로 필드 목록 반환"""
+        if not urls:
+            return []
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            return list(executor.map(self.fetch_fields, urls))
+    
+    def close(self):
+        """연결 풀 정리"""
+        self.session.close()
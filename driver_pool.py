@@ -0,0 +1,143 @@
+import threading
+import time
+from contextlib import contextmanager
+
+
+class DriverPool:
+    """여러 요청이 공유하는 웜 브라우저 풀"""
+    
+    def __init__(self, size=2, **scraper_kwargs):
+        self.size = size
+        self.scraper_kwargs = scraper_kwargs
+        self._idle = []            # 반납된 브라우저 (마지막에 반납된 것부터 대여)
+        # _idle/_created/_closed 보호, 반납되거나 자리가 비면 대기 중인 acquire를 깨움
+        self._cond = threading.Condition()
+        self._created = 0
+        self._closed = False
+    
+    def _create(self):
+        """새 브라우저 생성"""
+        # selenium은 실제로 브라우저가 필요할 때 import (서버 시작 시간 단축)
+        from st11_scraper import ST11Scraper
+        print("🚀 풀에 새 브라우저 추가")
+        return ST11Scraper(**self.scraper_kwargs)
+    
+    def _free_slot(self):
+        """브라우저 한 자리를 비우고 대기 중인 요청 하나를 깨움 (새 브라우저를 띄울 수 있게)"""
+        with self._cond:
+            self._created -= 1
+            self._cond.notify()
+    
+    def _discard(self, scraper):
+        """죽은 브라우저를 버리고 자리를 비움"""
+        try:
+            scraper.close()
+        except Exception:
+            pass
+        self._free_slot()
+    
+    def _put_idle(self, scraper):
+        """브라우저를 대기 목록에 넣고 대기 중인 요청 하나를 깨움"""
+        with self._cond:
+            self._idle.append(scraper)
+            self._cond.notify()
+    
+    def prewarm(self, count=1):
+        """백그라운드 스레드에서 브라우저 count개를 미리 띄우고 검색 페이지로 예열
+        
+        예열 중인 브라우저도 풀 크기에 포함되므로, 그동안 들어온 요청은
+        새 브라우저를 또 띄우지 않고 예열이 끝나기를 기다린다.
+        """
+        def run():
+            for _ in range(min(count, self.size)):
+                with self._cond:
+                    if self._closed or self._created >= self.size:
+                        return
+                    self._created += 1
+                try:
+                    scraper = self._create()
+                except Exception as e:
+                    self._free_slot()
+                    print(f"⚠️  브라우저 예열 실패: {e}")
+                    return
+                scraper.warm_up()
+                if self._closed:
+                    self._discard(scraper)
+                    return
+                self._put_idle(scraper)
+            print("🔥 브라우저 예열 완료")
+        
+        thread = threading.Thread(target=run, name='driver-prewarm', daemon=True)
+        thread.start()
+        return thread
+    
+    def acquire(self, timeout=None):
+        """브라우저 대여 (없으면 생성, 풀이 꽉 찼으면 반납되거나 자리가 빌 때까지 대기)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("DriverPool이 이미 종료되었습니다")
+                    if self._idle:
+                        scraper = self._idle.pop()
+                        break
+                    if self._created < self.size:
+                        self._created += 1
+                        scraper = None
+                        break
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError("사용 가능한 브라우저가 없습니다")
+                    self._cond.wait(remaining)
+            
+            if scraper is None:
+                try:
+                    return self._create()
+                except Exception:
+                    self._free_slot()
+                    raise
+            
+            # 상태 확인: 죽은 브라우저는 교체
+            if scraper.is_alive():
+                return scraper
+            print("⚠️  응답 없는 브라우저 교체")
+            self._discard(scraper)
+    
+    def release(self, scraper):
+        """브라우저 반납 (상태 초기화 후 풀에 복귀)"""
+        if self._closed:
+            self._discard(scraper)
+            return
+        
+        try:
+            scraper.reset_state()
+        except Exception:
+            self._discard(scraper)
+            return
+        self._put_idle(scraper)
+    
+    def has_warm_idle(self):
+        """바로 빌릴 수 있는 예열된 브라우저가 있는지 (첫 결과 지표의 warm/cold 구분용)"""
+        with self._cond:
+            return any(scraper.warm for scraper in self._idle)
+    
+    @contextmanager
+    def lease(self, timeout=None):
+        """with pool.lease() as scraper: 형태로 사용"""
+        scraper = self.acquire(timeout=timeout)
+        try:
+            yield scraper
+        finally:
+            self.release(scraper)
+    
+    def close_all(self):
+        """풀의 모든 브라우저 종료"""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            # 대기 중인 요청은 깨어나 종료된 풀임을 확인
+            self._cond.notify_all()
+        for scraper in idle:
+            self._discard(scraper)
@@ -0,0 +1,98 @@
+import csv
+import io
+import json
+
+# CSV 컬럼 (상품 dict 키, 헤더 이름)
+CSV_COLUMNS = [
+    ('name', '상품명'), ('price', '가격'), ('unit_price', '개당 가격'), ('quantity', '수량'),
+    ('price_per_100', '100단위 가격'), ('unit_type', '단위'), ('delivery', '배송'), ('is_ad', '광고'),
+    ('rating', '별점'), ('review_count', '리뷰'), ('seller_satisfaction', '판매자 만족'),
+    ('seller_response', '응답률'), ('seller_sales', '판매량'), ('link', '링크'),
+]
+
+EXPORT_FORMATS = {
+    'txt': 'text/plain',
+    'csv': 'text/csv',
+    'jsonl': 'application/jsonl',
+}
+
+
+def write_txt(products, fp, title="11번가 검색 결과", keywords=None, sort_text=None):
+    """사람이 읽는 텍스트 형식으로 한 줄씩 기록"""
+    fp.write("=" * 70 + "\n")
+    fp.write(f"{title}\n")
+    fp.write("=" * 70 + "\n\n")
+    if keywords:
+        fp.write(f"검색어: {', '.join(keywords)}\n")
+    if sort_text:
+        fp.write(f"정렬: {sort_text}\n")
+    fp.write(f"총 {len(products)}개\n")
+    fp.write("=" * 70 + "\n\n")
+    
+    for idx, p in enumerate(products, 1):
+        fp.write(f"{idx}. {p['name']}\n")
+        if p['quantity'] > 1:
+            fp.write(f"   총 가격: {p['price']:,}원\n")
+            fp.write(f"   개당 가격: 약 {int(p['unit_price']):,}원 ({p['quantity']}개)\n")
+        else:
+            fp.write(f"   가격: {p['price']:,}원\n")
+        if p.get('price_per_100') is not None:
+            fp.write(f"   100{p['unit_type']}당: 약 {int(p['price_per_100']):,}원\n")
+        fp.write(f"   배송: {p['delivery']}\n")
+        if p.get('rating'):
+            fp.write(f"   별점: {p['rating']:.1f}\n")
+        if p.get('review_count'):
+            fp.write(f"   리뷰: {p['review_count']:,}개\n")
+        if p.get('seller_satisfaction'):
+            fp.write(f"   판매자 만족: {p['seller_satisfaction']}\n")
+        if p.get('seller_response'):
+            fp.write(f"   응답률: {p['seller_response']}\n")
+        if p.get('seller_sales'):
+            fp.write(f"   판매량: {p['seller_sales']}\n")
+        fp.write(f"   링크: {p['link']}\n")
+        if p.get('is_ad'):
+            fp.write("   [광고]\n")
+        fp.write("\n")
+
+
+def write_csv(products, fp, **_):
+    """CSV 형식으로 한 행씩 기록"""
+    writer = csv.writer(fp)
+    writer.writerow(['순위'] + [label for _, label in CSV_COLUMNS])
+    for idx, p in enumerate(products, 1):
+        writer.writerow([idx] + [p.get(key) for key, _ in CSV_COLUMNS])
+
+
+def write_jsonl(products, fp, **_):
+    """상품 하나당 JSON 한 줄로 기록"""
+    for p in products:
+        fp.write(json.dumps(p, ensure_ascii=False))
+        fp.write("\n")
+
+
+WRITERS = {
+    'txt': write_txt,
+    'csv': write_csv,
+    'jsonl': write_jsonl,
+}
+
+
+def export(products, fp, fmt='txt', **meta):
+    """fmt 형식으로 파일/버퍼 fp에 스트리밍 기록 (meta: title, keywords, sort_text)"""
+    WRITERS[fmt](products, fp, **meta)
+
+
+def export_file(products, path, fmt='txt', **meta):
+    """파일로 저장 (CSV는 엑셀 호환을 위해 BOM 포함)"""
+    encoding = 'utf-8-sig' if fmt == 'csv' else 'utf-8'
+    with open(path, 'w', encoding=encoding, newline='' if fmt == 'csv' else None) as fp:
+        export(products, fp, fmt, **meta)
+    return path
+
+
+def export_bytes(products, fmt='txt', **meta):
+    """다운로드 버튼/텔레그램 첨부용 bytes 생성"""
+    buffer = io.StringIO(newline='' if fmt == 'csv' else None)
+    export(products, buffer, fmt, **meta)
+    encoding = 'utf-8-sig' if fmt == 'csv' else 'utf-8'
+    return buffer.getvalue().encode(encoding)
@@ -0,0 +1,228 @@
+import os
+import threading
+import time
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from metrics import registry
+
+
+class Job:
+    """백그라운드 작업 하나의 상태 (UI가 job id로 폴링)"""
+    
+    def __init__(self, job_id, name='', meta=None):
+        self.id = job_id
+        self.name = name
+        self.meta = meta or {}     # 재접속한 UI가 결과를 그릴 때 필요한 정보
+        self.state = 'queued'      # queued → running → done / failed
+        self.progress = 0.0
+        self.status = "⏳ 대기 중..."
+        self.preview = []          # 진행 중 미리보기 (키워드, 상품)
+        self.notes = []            # 완료 후 보여줄 안내 메시지
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.finished_at = None
+        self._lock = threading.Lock()
+    
+    def update(self, progress=None, status=None):
+        """진행률(0~1)과 상태 문구 갱신"""
+        with self._lock:
+            if progress is not None:
+                self.progress = max(0.0, min(1.0, progress))
+            if status is not None:
+                self.status = status
+    
+    def add_preview(self, keyword, products):
+        """미리보기에 상품 추가"""
+        with self._lock:
+            self.preview.extend((keyword, p) for p in products)
+    
+    def snapshot_preview(self, limit=200):
+        """최근 미리보기 상품 목록 복사본"""
+        with self._lock:
+            return list(self.preview[-limit:])
+    
+    @property
+    def done(self):
+        return self.state in ('done', 'failed')
+
+
+class JobRunner:
+    """검색 작업을 워커 풀에서 실행 (서버 전체 동시 브라우저 작업 수 제한)"""
+    
+    def __init__(self, max_jobs=2, keep_seconds=3600):
+        self.max_jobs = max_jobs
+        self.keep_seconds = keep_seconds
+        self._executor = ThreadPoolExecutor(max_workers=max_jobs, thread_name_prefix='search-job')
+        self._jobs = {}
+        self._lock = threading.Lock()
+    
+    def submit(self, fn, *args, name='', meta=None, **kwargs):
+        """fn(job, *args, **kwargs)를 백그라운드에서 실행하고 Job 반환"""
+        self._cleanup()
+        job = Job(uuid.uuid4().hex[:12], name, meta)
+        with self._lock:
+            self._jobs[job.id] = job
+        self._executor.submit(self._run, job, fn, args, kwargs)
+        return job
+    
+    def _run(self, job, fn, args, kwargs):
+        job.state = 'running'
+        job.update(status="🚀 작업 시작...")
+        try:
+            job.result = fn(job, *args, **kwargs)
+            job.update(1.0, "✅ 검색 완료!")
+            job.state = 'done'
+        except Exception as e:
+            job.error = f"{e}\n\n{traceback.format_exc()}"
+            job.update(status=f"❌ 에러 발생: {e}")
+            job.state = 'failed'
+        finally:
+            job.finished_at = time.time()
+            # 설정되어 있으면 지표를 텍스트 파일로 내보내기
+            metrics_file = os.getenv('METRICS_FILE')
+            if metrics_file:
+                registry.write_file(metrics_file)
+    
+    def get(self, job_id):
+        """job id로 작업 조회 (없거나 만료되면 None)"""
+        with self._lock:
+            return self._jobs.get(job_id)
+    
+    def queue_position(self, job):
+        """대기 중인 작업 앞에 있는 대기 작업 수"""
+        with self._lock:
+            waiting = [j for j in self._jobs.values() if j.state == 'queued']
+        waiting.sort(key=lambda j: j.created_at)
+        return waiting.index(job) if job in waiting else 0
+    
+    def _cleanup(self):
+        """끝난 지 keep_seconds가 지난 작업 삭제"""
+        now = time.time()
+        with self._lock:
+            expired = [
+                job_id for job_id, job in self._jobs.items()
+                if job.finished_at and now - job.finished_at > self.keep_seconds
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+
+
+def run_search(job, options, pool=None, search_cache=None, detail_cache=None, telegram=None):
+    """검색 → 정렬 → 상세 정보 → 텔레그램 전송까지 실행하고 상품 목록 반환
+    
+    options: keywords, max_items, sort_option, detail_count, send_telegram, show_browser, workers
+    """
+    search_keywords = options['keywords']
+    sort_option = options['sort_option']
+    show_browser = options['show_browser']
+    
+    job.update(0.05, "🚀 크롤러 초기화 중...")
+    # selenium은 실제로 브라우저가 필요할 때 import
+    from st11_scraper import ST11Scraper, search_many
+    if show_browser:
+        # 브라우저 표시 모드는 풀을 쓰지 않고 전용 브라우저 사용
+        scraper = ST11Scraper(headless=False)
+        start = 'cold'
+    else:
+        # 풀 브라우저는 캐시에 없는 키워드를 검색할 때만 빌림
+        scraper = None
+        start = 'warm' if pool.has_warm_idle() else 'cold'
+    
+    # 첫 결과까지 걸린 시간 (작업 제출 시점부터, 브라우저 상태별로 기록)
+    first_result = []
+    
+    def on_batch(keyword, products):
+        if not first_result:
+            first_result.append(time.time() - job.created_at)
+            registry.observe('search_first_result_seconds', first_result[0], start=start)
+        job.add_preview(keyword, products)
+    
+    try:
+        job.update(0.1, f"🔍 {len(search_keywords)}개 키워드 검색 중...")
+        
+        # 각 키워드를 여러 브라우저에서 병렬 검색 (중복 제거 포함)
+        def on_keyword_done(done, total, keyword, count):
+            job.update(0.1 + 0.55 * done / total, f"🔍 '{keyword}' 완료: {count}개 ({done}/{total})")
+        
+        unique_results = search_many(
+            search_keywords,
+            max_items=options['max_items'],
+            workers=options['workers'],
+            progress_callback=on_keyword_done,
+            pool=None if show_browser else pool,
+            cache=None if show_browser else search_cache,
+            batch_callback=on_batch,
+            error_callback=lambda keyword, e: job.notes.append(f"❌ '{keyword}' 검색 실패: {e}"),
+            scraper=scraper,
+            scraper_kwargs={'headless': False}
+        )
+        if first_result:
+            job.notes.append(f"⏱️ 첫 결과까지 {first_result[0]:.1f}초 ({start} start)")
+        
+        # 정렬
+        job.update(0.7, "📊 정렬 중...")
+        unique_results = ST11Scraper.sort_by_price(
+            unique_results,
+            ascending="낮은 순" in sort_option,
+            by_unit="개당 가격" in sort_option,
+            by_volume="용량당 가격" in sort_option
+        )
+        
+        normal_products = [p for p in unique_results if not p.get('is_ad')]
+        ad_products = [p for p in unique_results if p.get('is_ad')]
+        
+        # 상세 정보 수집
+        detail_count = options['detail_count']
+        if detail_count and normal_products:
+            job.update(0.75, f"⭐ 상위 {detail_count}개 상품의 상세 정보 수집 중...")
+            if show_browser:
+                scraper.fetch_product_details(normal_products, max_count=detail_count, cache=detail_cache)
+            else:
+                with pool.lease(timeout=120) as leased:
+                    leased.fetch_product_details(normal_products, max_count=detail_count, cache=detail_cache)
+            if detail_cache is not None:
+                cache_stats = detail_cache.stats()
+                job.notes.append(f"💾 상세 캐시: 적중 {cache_stats['hits']} / 실패 {cache_stats['misses']}")
+        
+        # 텔레그램 전송
+        if options['send_telegram'] and unique_results and telegram is not None:
+            job.update(0.9, "📤 텔레그램 전송 중...")
+            try:
+                # 일반 상품 전송 (많으면 요약 + CSV 문서)
+                if normal_products:
+                    header = "".join([
+                        f"🛒 <b>11번가 검색 결과 (일반 상품)</b>\n",
+                        f"검색어: {', '.join(search_keywords)}\n",
+                        f"정렬: {sort_option}\n",
+                        f"총 {len(normal_products)}개\n",
+                        "=" * 40 + "\n\n"
+                    ])
+                    blocks = [ST11Scraper.format_product_info(product, idx) + "-" * 40 + "\n"
+                              for idx, product in enumerate(normal_products, 1)]
+                    telegram.send_results(header, blocks, normal_products,
+                                          filename=f"11st_normal_{int(time.time())}.csv")
+                
+                # 광고 상품 전송
+                if ad_products:
+                    header = "".join([
+                        f"🔴 <b>11번가 검색 결과 (광고 상품)</b>\n",
+                        f"검색어: {', '.join(search_keywords)}\n",
+                        f"총 {len(ad_products)}개\n",
+                        "=" * 40 + "\n\n"
+                    ])
+                    blocks = [ST11Scraper.format_product_info(product, idx) + "-" * 40 + "\n"
+                              for idx, product in enumerate(ad_products, 1)]
+                    telegram.send_results(header, blocks, ad_products,
+                                          filename=f"11st_ads_{int(time.time())}.csv")
+                
+                job.notes.append("✅ 텔레그램 전송 대기열에 추가!")
+            except Exception as e:
+                job.notes.append(f"❌ 텔레그램 전송 실패: {e}")
+        
+        return unique_results
+    
+    finally:
+        if show_browser:
+            scraper.close()
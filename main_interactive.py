@@ -1,5 +1,7 @@
 from st11_scraper import ST11Scraper
 from telegram_bot import TelegramBot
+from exporters import EXPORT_FORMATS, export_file
+from offer_groups import cheapest_offers
 import time
 
 def main():
@@ -30,8 +32,14 @@ def main():
     print("\n📝 정렬 방식을 선택하세요:")
     print("1. 총 가격 낮은 순 (기본)")
     print("2. 개당 가격 낮은 순 (묶음 상품 고려)")
-    sort_choice = input("➤ 선택 (1 또는 2): ").strip()
+    print("3. 용량당 가격 낮은 순 (100ml/100g 기준)")
+    sort_choice = input("➤ 선택 (1, 2 또는 3): ").strip()
     sort_by_unit = (sort_choice == '2')
+    sort_by_volume = (sort_choice == '3')
+    
+    # 같은 상품 묶기
+    print("\n📝 판매처만 다른 같은 상품은 최저가 하나만 보시겠습니까? (y/n)")
+    group_same = input("➤ 묶기: ").strip().lower() == 'y'
     
     # 텔레그램 전송
     print("\n📝 텔레그램으로 결과를 전송하시겠습니까? (y/n)")
@@ -50,33 +58,31 @@ def main():
     if send_telegram:
         telegram = TelegramBot()
     
-    all_results = []
-    
     try:
-        for keyword in search_keywords:
-            products = scraper.search_products(keyword, max_items=max_items)
-            
-            if products:
-                print(f"   📦 '{keyword}': {len(products)}개 수집됨\n")
-                all_results.extend(products)
-            
-            time.sleep(2)
+        def on_keyword_done(done, total, keyword, count):
+            print(f"   📦 '{keyword}': {count}개 수집됨 ({done}/{total})\n")
         
-        # 중복 제거
-        seen_links = set()
-        unique_results = []
-        for product in all_results:
-            if product['link'] not in seen_links:
-                seen_links.add(product['link'])
-                unique_results.append(product)
+        # 키워드별 병렬 검색 (중복 제거 포함)
+        unique_results = scraper.search_many(
+            search_keywords,
+            max_items=max_items,
+            workers=min(3, len(search_keywords)),
+            progress_callback=on_keyword_done
+        )
+        
+        # 같은 상품 묶기 (그룹마다 최저가만)
+        if group_same:
+            offer_total = len(unique_results)
+            unique_results = cheapest_offers(unique_results)
+            print(f"🧩 {offer_total}개 판매 상품 → {len(unique_results)}개 상품으로 묶음")
         
         # 정렬
-        unique_results = scraper.sort_by_price(unique_results, ascending=True, by_unit=sort_by_unit)
+        unique_results = scraper.sort_by_price(unique_results, ascending=True, by_unit=sort_by_unit, by_volume=sort_by_volume)
         
         # 결과 출력
         if unique_results:
             print("\n" + "=" * 70)
-            sort_text = "개당 가격" if sort_by_unit else "총 가격"
+            sort_text = "개당 가격" if sort_by_unit else "용량당 가격" if sort_by_volume else "총 가격"
             print(f"🎉 총 {len(unique_results)}개 제품 발견! ({sort_text} 낮은 순)")
             print("=" * 70 + "\n")
             
@@ -92,53 +98,33 @@ def main():
             # 텔레그램 전송
             if send_telegram:
                 print("\n📤 텔레그램 전송 중...")
-                message = f"🛒 <b>11번가 검색 결과</b>\n"
-                message += f"검색어: {', '.join(search_keywords)}\n"
-                message += f"정렬: {sort_text} 낮은 순\n"
-                message += f"총 {len(unique_results)}개 발견!\n"
-                message += "=" * 40 + "\n\n"
-                
-                for idx, product in enumerate(unique_results[:15], 1):
-                    message += scraper.format_product_info(product, idx)
-                    message += "-" * 40 + "\n"
+                header = "".join([
+                    f"🛒 <b>11번가 검색 결과</b>\n",
+                    f"검색어: {', '.join(search_keywords)}\n",
+                    f"정렬: {sort_text} 낮은 순\n",
+                    f"총 {len(unique_results)}개 발견!\n",
+                    "=" * 40 + "\n\n"
+                ])
+                blocks = [scraper.format_product_info(product, idx) + "-" * 40 + "\n"
+                          for idx, product in enumerate(unique_results, 1)]
+                telegram.send_results(header, blocks, unique_results,
+                                      filename=f"11st_results_{int(time.time())}.csv")
                 
-                if len(message) > 4000:
-                    parts = [message[i:i+4000] for i in range(0, len(message), 4000)]
-                    for part in parts:
-                        telegram.send_message(part)
-                        time.sleep(1)
-                else:
-                    telegram.send_message(message)
-                
-                print("✅ 텔레그램 전송 완료!")
+                print("✅ 텔레그램 전송 대기열에 추가! (백그라운드 전송)")
             
             # 파일 저장
             print("\n📝 결과를 파일로 저장하시겠습니까? (y/n)")
             save_file = input("➤ 저장: ").strip().lower() == 'y'
             
             if save_file:
-                filename = f"11st_results_{int(time.time())}.txt"
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write("=" * 70 + "\n")
-                    f.write("11번가 검색 결과\n")
-                    f.write("=" * 70 + "\n\n")
-                    f.write(f"검색어: {', '.join(search_keywords)}\n")
-                    f.write(f"정렬: {sort_text} 낮은 순\n")
-                    f.write(f"총 {len(unique_results)}개 발견\n")
-                    f.write("=" * 70 + "\n\n")
-                    
-                    for idx, product in enumerate(unique_results, 1):
-                        f.write(f"{idx}. {product['name']}\n")
-                        if product['quantity'] > 1:
-                            f.write(f"   총 가격: {product['price']:,}원\n")
-                            f.write(f"   개당 가격: 약 {int(product['unit_price']):,}원 ({product['quantity']}개)\n")
-                        else:
-                            f.write(f"   가격: {product['price']:,}원\n")
-                        f.write(f"   배송: {product['delivery']}\n")
-                        f.write(f"   링크: {product['link']}\n")
-                        if product.get('is_ad'):
-                            f.write(f"   [광고]\n")
-                        f.write("\n")
+                print("📝 파일 형식 (txt/csv/jsonl, 기본: txt)")
+                export_format = input("➤ 형식: ").strip().lower()
+                if export_format not in EXPORT_FORMATS:
+                    export_format = 'txt'
+                
+                filename = f"11st_results_{int(time.time())}.{export_format}"
+                export_file(unique_results, filename, export_format,
+                            keywords=search_keywords, sort_text=f"{sort_text} 낮은 순")
                 
                 print(f"✅ {filename}에 저장 완료!")
         else:
@@ -156,6 +142,9 @@ def main():
         traceback.print_exc()
     finally:
         scraper.close()
+        if send_telegram:
+            print("📤 남은 텔레그램 메시지 전송 대기 중...")
+            telegram.flush()
         print("\n" + "=" * 70)
         print("🎉 프로그램 종료!")
         print("=" * 70)
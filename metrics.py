@@ -0,0 +1,134 @@
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+# 히스토그램 버킷 상한 (초)
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+HELP = {
+    'scraper_driver_start_seconds': '브라우저(WebDriver) 시작 시간',
+    'scraper_search_seconds': '키워드 하나 검색 전체 시간',
+    'scraper_search_stage_seconds': '검색 단계별 시간 (page_load, scroll, parse)',
+    'scraper_detail_seconds': '상세 정보 수집 시간 (mode=http: 페이지 1개, mode=browser: 상품 1개)',
+    'scraper_parse_failures_total': '파싱 실패로 건너뛴 항목 수',
+    'scraper_detail_failures_total': '상세 정보 수집 실패 수',
+    'scraper_pages_total': '브라우저로 연 페이지 수 (page=search|detail, mode=lean|full)',
+    'scraper_page_bytes_total': '브라우저가 받은 전송 바이트 합계 (평균 = bytes_total / pages_total)',
+    'scraper_page_ready_seconds': '페이지 DOMContentLoaded까지 걸린 시간',
+    'scraper_warm_up_seconds': '예열 시 검색 페이지를 처음 여는 데 걸린 시간',
+    'search_first_result_seconds': '작업 제출부터 첫 결과까지 걸린 시간 (start=cold: 새 브라우저, warm: 예열/사용된 브라우저)',
+    'scraper_driver_restarts_total': '브라우저 재시작 수 (reason=pages|memory|crash)',
+    'telegram_send_seconds': '텔레그램 API 호출 시간',
+    'telegram_retries_total': '텔레그램 429 재시도 수',
+}
+
+
+class _Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+    
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """카운터/히스토그램 모음 (프로메테우스 텍스트 형식으로 내보내기)"""
+    
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._counters = {}
+        self._histograms = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _key(name, labels):
+        return name, tuple(sorted(labels.items()))
+    
+    def inc(self, name, amount=1, **labels):
+        """카운터 증가"""
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+    
+    def observe(self, name, value, **labels):
+        """히스토그램에 값(초) 기록"""
+        key = self._key(name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _Histogram(self.buckets)
+            histogram.observe(value)
+    
+    @contextmanager
+    def timer(self, name, **labels):
+        """with 블록 실행 시간을 히스토그램에 기록"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+    
+    def summary(self):
+        """UI 표시용 요약: [(이름, 라벨 문자열, 횟수, 평균 초 또는 None)]"""
+        rows = []
+        with self._lock:
+            for (name, labels), histogram in sorted(self._histograms.items()):
+                avg = histogram.sum / histogram.count if histogram.count else 0
+                rows.append((name, _format_labels(labels), histogram.count, avg))
+            for (name, labels), value in sorted(self._counters.items()):
+                rows.append((name, _format_labels(labels), value, None))
+        return rows
+    
+    def render_prometheus(self):
+        """프로메테우스 텍스트 형식 문자열"""
+        lines = []
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+            counters = sorted(self._counters.items())
+        
+        described = set()
+        for (name, labels), histogram in histograms:
+            if name not in described:
+                described.add(name)
+                lines.append(f"# HELP {name} {HELP.get(name, name)}")
+                lines.append(f"# TYPE {name} histogram")
+            cumulative = 0
+            for bound, count in zip(histogram.buckets, histogram.counts):
+                cumulative += count
+                lines.append(f"{name}_bucket{_format_labels(labels + (('le', str(bound)),))} {cumulative}")
+            lines.append(f"{name}_bucket{_format_labels(labels + (('le', '+Inf'),))} {histogram.count}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {histogram.sum:.6f}")
+            lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+        
+        for (name, labels), value in counters:
+            if name not in described:
+                described.add(name)
+                lines.append(f"# HELP {name} {HELP.get(name, name)}")
+                lines.append(f"# TYPE {name} counter")
+            lines.append(f"{name}{_format_labels(labels)} {value}")
+        
+        return "\n".join(lines) + "\n"
+    
+    def write_file(self, path):
+        """프로메테우스 텍스트 파일로 저장 (node_exporter textfile 수집용)"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self.render_prometheus())
+        os.replace(tmp_path, path)
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{value}"' for key, value in labels) + "}"
+
+
+# 프로세스 전체 공용 레지스트리
+registry = MetricsRegistry()
@@ -0,0 +1,168 @@
+import re
+from functools import lru_cache
+from zlib import crc32
+from quantity_parser import QUANTITY_RE
+
+# 상품명 정규화: [무료배송], (당일발송) 같은 광고 문구와 개수/용량을 한 번에 제거
+# 괄호 안이 광고 문구일 때만 지운다 ("(라벤더향)" 같은 옵션은 다른 상품이므로 이름 특징으로 남김)
+PROMO_WORDS = r'(?:무료배송|무배|당일발송|당일출고|오늘출발|빠른배송|특가|할인|쿠폰|이벤트|사은품|증정|행사|한정|best|베스트|인기|정품)'
+TAG_RE = re.compile(
+    rf'\[[^\]]*{PROMO_WORDS}[^\]]*\]|【[^】]*{PROMO_WORDS}[^】]*】|\([^)]*{PROMO_WORDS}[^)]*\)'
+)
+NOISE_RE = re.compile(f'{TAG_RE.pattern}|{QUANTITY_RE.pattern}')
+WORD_RE = re.compile(r'[^\W_]+')
+
+NGRAM = 2                 # 단어 안 문자 n-gram 길이 (한글은 글자 하나가 음절이라 2로도 충분히 구분됨)
+BRAND_WEIGHT = 3          # 첫 단어(대개 브랜드)를 몇 번 더 세는지 - 브랜드만 다른 상품이 묶이지 않게
+BANDS = 4                 # LSH 밴드 수
+ROWS = 4                  # 밴드당 MinHash 값 수 (BANDS * ROWS개 bin)
+# 버킷마다 유사도를 직접 비교할 기존 상품 수 (재현율 상한)
+# 버킷에는 먼저 들어온 MAX_COMPARE개만 남긴다. 같은 버킷에 다른 상품이 먼저 가득 차 있으면
+# 뒤에 온 상품은 그 버킷으로는 같은 그룹을 찾지 못하므로, 다른 밴드에서도 겹치지 않으면 따로 남는다.
+# 2만 개 합성 데이터(정답 1,920그룹, 모든 후보를 비교하면 1,919그룹)에서 8이면 1,926그룹, 3이면 2,017그룹
+MAX_COMPARE = 8
+EMPTY = 1 << 32           # 빈 bin 값 (crc32 // bins는 항상 이보다 작음)
+
+
+def normalize_name(name):
+    """비교용 상품명 (소문자, 개수/용량과 광고 문구/기호 제거 후 단어를 공백으로 연결)
+
+    개수/용량은 따로 키로 비교하므로 이름 유사도에서는 뺀다.
+    """
+    return ' '.join(WORD_RE.findall(NOISE_RE.sub(' ', name.lower())))
+
+
+def minhash(hashes, bins=BANDS * ROWS):
+    """one-permutation MinHash: 해시 한 번으로 bins개 최솟값 서명 생성
+
+    해시를 bin 번호(h % bins)와 값(h // bins)으로 나눠 bin별 최솟값을 남긴다.
+    빈 bin은 EMPTY로 둔다 (비슷한 이름은 빈 bin도 대개 같고, 후보는 자카드 유사도로 다시 확인).
+    """
+    signature = [EMPTY] * bins
+    for h in hashes:
+        b = h % bins
+        value = h // bins
+        if value < signature[b]:
+            signature[b] = value
+    return signature
+
+
+@lru_cache(maxsize=65536)
+def _word_features(word):
+    """단어 하나의 특징 해시 (같은 단어가 여러 상품명에 반복되므로 캐시)"""
+    # 글자마다 4바이트라 n-gram을 바이트 슬라이스로 바로 자를 수 있음
+    data = word.encode('utf-32-le')
+    features = {crc32(data, 1)}
+    if len(word) <= NGRAM:
+        features.add(crc32(data))
+    else:
+        features.update([crc32(data[i:i + 4 * NGRAM]) for i in range(0, len(data) - 4 * NGRAM + 4, 4)])
+    return frozenset(features)
+
+
+@lru_cache(maxsize=65536)
+def _brand_features(word):
+    """첫 단어에 가중치를 주는 추가 특징 해시"""
+    data = word.encode('utf-32-le')
+    return frozenset([crc32(data, 2 + k) for k in range(BRAND_WEIGHT)])
+
+
+def shingles(text):
+    """정규화한 상품명의 특징 해시 집합 (단어 안 문자 n-gram + 단어 + 가중치를 준 첫 단어)
+
+    실행마다 같은 그룹이 나오도록 파이썬 hash() 대신 crc32 사용
+    """
+    words = text.split()
+    if not words:
+        return {crc32(text.encode('utf-32-le'))}
+    return set(_brand_features(words[0])).union(*map(_word_features, words))
+
+
+def group_offers(names, keys=None, threshold=0.6):
+    """비슷한 상품명을 묶어 이름마다 그룹 번호 반환 (처음 나온 순서대로 0, 1, 2...)
+
+    keys(예: 개수/용량)가 다른 상품은 이름이 비슷해도 묶지 않는다.
+    MinHash LSH로 후보를 찾고, n-gram 자카드 유사도가 threshold 이상인 쌍만 합친다.
+    버킷마다 MAX_COMPARE개까지만 비교하므로 재현율에 상한이 있다 (MAX_COMPARE 참고).
+
+    속도 요구(상품 수만 개를 1초보다 훨씬 빨리)는 아직 맞추지 못한다. 1코어 환경 측정으로
+    판매처 중복이 흔한 2만 개는 약 0.35초지만, 서로 다른 이름 2만 개는 약 0.7초, 5만 개는 약 2초 걸린다.
+    이름마다 도는 정규화/해시/MinHash/버킷 처리(이름당 수십 µs)가 모두 파이썬이라 개수에 비례해 늘어나므로,
+    목표를 맞추려면 이 단계들을 C 확장 등 파이썬 밖으로 옮겨야 한다.
+    """
+    if keys is None:
+        keys = [None] * len(names)
+
+    # 정규화한 이름과 키가 완전히 같은 상품은 바로 같은 그룹 (LSH는 서로 다른 이름끼리만)
+    distinct = {}
+    members_of = [distinct.setdefault((normalize_name(name), key), len(distinct))
+                  for name, key in zip(names, keys)]
+    entries = list(distinct)
+
+    count = len(entries)
+    parent = list(range(count))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    sets = []
+    buckets = {}
+
+    for i, (text, key) in enumerate(entries):
+        hashes = shingles(text)
+        sets.append(hashes)
+        signature = minhash(hashes)
+
+        # (밴드 번호, 키, 밴드의 ROWS개 값)이 같은 상품끼리 같은 버킷
+        # 여러 밴드에서 겹친 후보는 한 번만 비교
+        candidates = set()
+        for band, rows in enumerate(zip(*[iter(signature)] * ROWS)):
+            members = buckets.setdefault((band, key, rows), [])
+            candidates.update(members)
+            if len(members) < MAX_COMPARE:
+                members.append(i)
+
+        size = len(hashes)
+        for j in candidates:
+            other = j if parent[j] == j else find(j)
+            if other == i:
+                continue
+            shared = len(hashes & sets[j])
+            if shared >= threshold * (size + len(sets[j]) - shared):
+                parent[other] = i
+
+    labels = []
+    numbering = {}
+    for i in members_of:
+        labels.append(numbering.setdefault(find(i), len(numbering)))
+    return labels
+
+
+def quantity_key(product):
+    """묶음 개수와 용량이 모두 같은 상품끼리만 묶기 위한 키"""
+    return product.get('quantity'), product.get('unit_amount'), product.get('unit_type')
+
+
+def cheapest_offer_indices(labels, prices):
+    """그룹마다 가장 싼 상품의 (행 번호, 그룹 크기) 목록 (행 번호 순)"""
+    best = {}
+    sizes = {}
+    for i, (label, price) in enumerate(zip(labels, prices)):
+        sizes[label] = sizes.get(label, 0) + 1
+        if label not in best or price < prices[best[label]]:
+            best[label] = i
+    return sorted((i, sizes[label]) for label, i in best.items())
+
+
+def cheapest_offers(products, threshold=0.6):
+    """같은 상품으로 묶인 판매처 중 최저가 상품만 남김 (offer_count에 묶인 판매처 수)"""
+    labels = group_offers([p['name'] for p in products], [quantity_key(p) for p in products], threshold)
+    picked = []
+    for i, size in cheapest_offer_indices(labels, [p['price'] for p in products]):
+        product = dict(products[i])
+        product['offer_count'] = size
+        picked.append(product)
+    return picked
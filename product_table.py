@@ -0,0 +1,134 @@
+from array import array
+from offer_groups import group_offers, cheapest_offer_indices
+from quantity_parser import volume_order
+
+# 컬럼 이름과 저장 방식 (array 타입코드, None이면 일반 리스트: 문자열/None 허용 값)
+PRODUCT_COLUMNS = {
+    'content_no': None,
+    'name': None,
+    'price': 'q',
+    'unit_price': 'd',
+    'quantity': 'i',
+    'unit_amount': None,
+    'unit_type': None,
+    'price_per_100': None,
+    'link': None,
+    'delivery': None,
+    'is_ad': 'b',
+    'rating': None,
+    'review_count': None,
+    'seller_satisfaction': None,
+    'seller_response': None,
+    'seller_sales': None,
+    'offer_count': None,     # cheapest_offers로 묶였을 때 같은 상품 판매처 수
+}
+
+
+class ProductTable:
+    """상품 목록을 컬럼별로 저장하는 테이블 (dict 리스트 대신 세션에 보관)"""
+    
+    __slots__ = ('columns',)
+    
+    def __init__(self, columns=None):
+        if columns is None:
+            columns = {
+                name: array(typecode) if typecode else []
+                for name, typecode in PRODUCT_COLUMNS.items()
+            }
+        self.columns = columns
+    
+    @classmethod
+    def from_dicts(cls, products):
+        """기존 dict 형태 상품 목록을 테이블로 변환"""
+        table = cls()
+        for name, column in table.columns.items():
+            if name == 'is_ad':
+                column.extend(1 if p.get('is_ad') else 0 for p in products)
+            elif isinstance(column, array):
+                column.extend(p[name] for p in products)
+            else:
+                column.extend(p.get(name) for p in products)
+        return table
+    
+    def to_dicts(self):
+        """dict 형태 상품 목록으로 변환"""
+        return [self.row(i) for i in range(len(self))]
+    
+    def row(self, index):
+        """index번째 상품을 dict로 반환"""
+        product = {name: column[index] for name, column in self.columns.items()}
+        product['is_ad'] = bool(product['is_ad'])
+        return product
+    
+    def __len__(self):
+        return len(self.columns['link'])
+    
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.row(i)
+    
+    def column(self, name):
+        """컬럼 하나를 그대로 반환 (읽기 전용으로 사용)"""
+        return self.columns[name]
+    
+    def take(self, indices):
+        """주어진 행 번호만 골라 새 테이블 생성"""
+        indices = list(indices)
+        columns = {}
+        for name, column in self.columns.items():
+            values = [column[i] for i in indices]
+            columns[name] = array(column.typecode, values) if isinstance(column, array) else values
+        return ProductTable(columns)
+    
+    def filter(self, name, predicate):
+        """컬럼 값이 predicate를 만족하는 행만 남김"""
+        column = self.columns[name]
+        return self.take(i for i, value in enumerate(column) if predicate(value))
+    
+    def split_ads(self):
+        """(일반 상품, 광고 상품) 테이블로 분리"""
+        is_ad = self.columns['is_ad']
+        normal = [i for i, flag in enumerate(is_ad) if not flag]
+        ads = [i for i, flag in enumerate(is_ad) if flag]
+        return self.take(normal), self.take(ads)
+    
+    def dedup(self, name='link'):
+        """컬럼 값 기준 첫 번째 행만 남김"""
+        seen = set()
+        keep = []
+        for i, value in enumerate(self.columns[name]):
+            if value not in seen:
+                seen.add(value)
+                keep.append(i)
+        return self if len(keep) == len(self) else self.take(keep)
+    
+    def cheapest_offers(self, threshold=0.6):
+        """이름이 비슷하고 개수/용량이 같은 상품을 묶어 그룹마다 최저가 행만 남김"""
+        keys = list(zip(self.columns['quantity'], self.columns['unit_amount'], self.columns['unit_type']))
+        labels = group_offers(self.columns['name'], keys, threshold)
+        picked = cheapest_offer_indices(labels, self.columns['price'])
+        table = self.take(i for i, _ in picked)
+        table.columns['offer_count'] = [size for _, size in picked]
+        return table
+    
+    def sort(self, name, ascending=True):
+        """컬럼 기준 정렬 (값이 None인 행은 방향과 관계없이 맨 뒤)
+        
+        price_per_100은 단위(ml/g/매)가 다른 값끼리 섞지 않고 단위별로 정렬 (volume_order 참고)
+        """
+        column = self.columns[name]
+        if name == 'price_per_100':
+            return self.take(volume_order(column, self.columns['unit_type'], ascending))
+        known = [i for i, value in enumerate(column) if value is not None]
+        unknown = [i for i, value in enumerate(column) if value is None]
+        known.sort(key=column.__getitem__, reverse=not ascending)
+        return self.take(known + unknown)
+    
+    def mean(self, name):
+        """None을 뺀 평균 (값이 없으면 0)"""
+        values = [v for v in self.columns[name] if v is not None]
+        return sum(values) / len(values) if values else 0
+    
+    def count(self, name, predicate):
+        """컬럼 값이 predicate를 만족하는 행 수"""
+        return sum(1 for value in self.columns[name] if predicate(value))
@@ -0,0 +1,103 @@
+import re
+from bisect import bisect_right
+
+# 묶음 개수 단위 ("10개입"처럼 붙여 쓰는 경우 포함)
+COUNT_UNITS = r'(?:개입|개|입|팩|박스|묶음|병|캔|ea|p)'
+
+# 묶음 개수와 용량/중량을 한 번에 찾는 정규식 (이름들을 줄바꿈으로 이어 붙여 한 번에 스캔)
+# "x 3개"는 뒤의 단위까지 한 덩어리로 잡아 상품명 정규화 때 단위 글자가 남지 않게 함
+# 용량 뒤에 바로 붙는 배수("1.2Lx3")와 천 단위 쉼표("1,000ml")도 용량으로 인식
+QUANTITY_RE = re.compile(
+    r'(?P<amount>\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+(?:\.\d+)?)[ \t]*(?P<unit>ml|mℓ|l|ℓ|kg|g|매)(?![a-wyz])'
+    r'|(?P<count>\d+)[ \t]*' + COUNT_UNITS +
+    r'|x[ \t]*(?P<times>\d+)(?:[ \t]*' + COUNT_UNITS + r')?'
+)
+
+# 단위를 기준 단위(ml, g, 매)로 환산
+UNIT_SCALE = {
+    'ml': ('ml', 1), 'mℓ': ('ml', 1), 'l': ('ml', 1000), 'ℓ': ('ml', 1000),
+    'g': ('g', 1), 'kg': ('g', 1000),
+    '매': ('매', 1),
+}
+
+
+def parse_quantities(names):
+    """상품명 목록에서 묶음 개수와 용량/중량을 일괄 추출
+    
+    반환: 이름마다 {'count': 개수, 'amount': 기준 단위 용량 또는 None, 'unit': 'ml'|'g'|'매'|None}
+    """
+    results = [{'count': 1, 'amount': None, 'unit': None} for _ in names]
+    if not results:
+        return results
+    
+    lowered = [name.lower().replace('\n', ' ') for name in names]
+    starts = []
+    offset = 0
+    for name in lowered:
+        starts.append(offset)
+        offset += len(name) + 1
+    text = '\n'.join(lowered)
+    
+    for match in QUANTITY_RE.finditer(text):
+        result = results[bisect_right(starts, match.start()) - 1]
+        
+        if match.group('unit'):
+            if result['amount'] is None:
+                unit, scale = UNIT_SCALE[match.group('unit')]
+                amount = float(match.group('amount').replace(',', '')) * scale
+                if amount > 0:
+                    result['amount'] = amount
+                    result['unit'] = unit
+            continue
+        
+        if result['count'] == 1:
+            quantity = int(match.group('count') or match.group('times'))
+            if 1 < quantity < 1000:
+                result['count'] = quantity
+    
+    return results
+
+
+def apply_quantities(products):
+    """상품 목록에 개수, 개당 가격, 100ml/100g당 가격을 일괄 반영"""
+    parsed = parse_quantities([p['name'] for p in products])
+    
+    for product, info in zip(products, parsed):
+        quantity = info['count']
+        price = product['price']
+        product['quantity'] = quantity
+        product['unit_price'] = price / quantity if quantity > 1 else price
+        product['unit_type'] = info['unit']
+        
+        if info['amount']:
+            total_amount = info['amount'] * quantity
+            product['unit_amount'] = total_amount
+            product['price_per_100'] = price / total_amount * 100
+        else:
+            product['unit_amount'] = None
+            product['price_per_100'] = None
+    
+    return products
+
+
+def volume_order(prices_per_100, unit_types, ascending=True):
+    """용량당 가격 정렬 순서 (행 번호 목록)
+    
+    100ml당/100g당/100매당 가격은 단위가 다르면 비교할 수 없으므로 단위별로 따로 정렬하고,
+    상품이 가장 많은 단위부터 이어 붙인다. 용량을 모르는 상품은 방향과 관계없이 맨 뒤.
+    """
+    groups = {}
+    unknown = []
+    for i, (value, unit) in enumerate(zip(prices_per_100, unit_types)):
+        if value is None:
+            unknown.append(i)
+        else:
+            groups.setdefault(unit, []).append(i)
+    
+    order = []
+    # 상품 수가 같으면 먼저 나온 단위 먼저 (sorted는 안정 정렬)
+    for unit in sorted(groups, key=lambda u: len(groups[u]), reverse=True):
+        rows = groups[unit]
+        rows.sort(key=prices_per_100.__getitem__, reverse=not ascending)
+        order.extend(rows)
+    return order + unknown
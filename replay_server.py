@@ -0,0 +1,192 @@
+import html
+import json
+import os
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs, quote
+
+FIXTURE_DIR = os.getenv('REPLAY_FIXTURES', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures'))
+
+# kwd=synthetic-500 처럼 요청하면 녹화 없이 상품 N개짜리 검색 페이지 생성
+SYNTHETIC_RE = re.compile(r'^synthetic-(\d+)$')
+# pageNo=2 처럼 페이지 번호가 오면 카탈로그를 SYNTHETIC_PAGE_SIZE개씩 나눠서 응답
+SEARCH_PAGE_PARAM = os.getenv('ST11_SEARCH_PAGE_PARAM', 'pageNo')
+SYNTHETIC_PAGE_SIZE = 60
+
+SYNTHETIC_NAMES = [
+    "친환경 주방세제 리필 1.2L x 3개",
+    "비건 샴푸 500ml 2개입",
+    "무포장 고체 비누 100g 5p",
+    "대나무 칫솔 10개 세트",
+    "천연 세탁세제 2.5L",
+    "다회용 밀랍랩 3매",
+]
+
+
+def _search_path(keyword):
+    return os.path.join(FIXTURE_DIR, 'search', quote(keyword, safe='') + '.html')
+
+
+def _product_path(content_no):
+    return os.path.join(FIXTURE_DIR, 'products', f"{content_no}.html")
+
+
+def synthetic_search_page(count, start=0):
+    """상품 카드 start~count번째로 만든 검색 결과 HTML (실제 페이지와 같은 data-log-body 구조)"""
+    cards = []
+    for i in range(start, count):
+        content_no = 900000000 + i
+        log_body = {
+            'content_no': str(content_no),
+            'last_discount_price': str(3000 + (i * 137) % 40000),
+            'ad_yn': 'Y' if i % 10 == 0 else 'N',
+            'snippet_object': {'delivery_price': '무료배송' if i % 3 else '배송비 3,000원'},
+        }
+        name = f"{SYNTHETIC_NAMES[i % len(SYNTHETIC_NAMES)]} #{i}"
+        cards.append(
+            f'<li><a class="c-card-item__anchor" href="/products/{content_no}" '
+            f'data-log-body="{html.escape(json.dumps(log_body, ensure_ascii=False))}">'
+            f'<span class="sr-only">{html.escape(name)}</span></a></li>'
+        )
+    return f"<html><head><meta charset='utf-8'></head><body><ul>{''.join(cards)}</ul></body></html>"
+
+
+def synthetic_product_page(content_no):
+    """별점/리뷰/판매자 정보가 있는 상세 페이지 HTML"""
+    seed = int(content_no) if str(content_no).isdigit() else 0
+    rating = 3 + (seed % 20) / 10
+    reviews = seed % 5000
+    return f"""<html><head><meta charset='utf-8'>
+<meta name="description" content="평점: {rating:.1f} 리뷰수: {reviews}">
+</head><body>
+<dl class="info_cont">
+  <dt>판매자만족도</dt><dd>{90 + seed % 10}%</dd>
+  <dt>응답률</dt><dd>{80 + seed % 20}%</dd>
+  <dt>판매량</dt><dd><em class="score{1 + seed % 5}">판매량</em></dd>
+</dl>
+</body></html>"""
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    """녹화된 11번가 페이지를 돌려주는 로컬 대역 서버"""
+    
+    latency = 0.0
+    
+    def do_GET(self):
+        url = urlparse(self.path)
+        time.sleep(self.latency)
+        
+        if url.path.endswith('/Search.tmall'):
+            keyword = parse_qs(url.query).get('kwd', [''])[0]
+            synthetic = SYNTHETIC_RE.match(keyword)
+            if synthetic:
+                total = int(synthetic.group(1))
+                page = parse_qs(url.query).get(SEARCH_PAGE_PARAM, [''])[0]
+                if page.isdigit():
+                    start = (int(page) - 1) * SYNTHETIC_PAGE_SIZE
+                    self._send_html(synthetic_search_page(min(total, start + SYNTHETIC_PAGE_SIZE), start))
+                else:
+                    self._send_html(synthetic_search_page(total))
+            else:
+                self._send_file(_search_path(keyword))
+            return
+        
+        product = re.match(r'^/products/(\w+)$', url.path)
+        if product:
+            path = _product_path(product.group(1))
+            if os.path.exists(path):
+                self._send_file(path)
+            else:
+                self._send_html(synthetic_product_page(product.group(1)))
+            return
+        
+        self.send_error(404)
+    
+    def _send_file(self, path):
+        if not os.path.exists(path):
+            self.send_error(404)
+            return
+        with open(path, 'rb') as f:
+            self._send_html(f.read())
+    
+    def _send_html(self, body):
+        data = body.encode('utf-8') if isinstance(body, str) else body
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+def start_replay_server(port=0, latency=0.0):
+    """백그라운드 스레드로 대역 서버 실행 후 (서버, 기본 URL) 반환"""
+    handler = type('ConfiguredReplayHandler', (ReplayHandler,), {'latency': latency})
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+def use_replay_urls(base_url):
+    """스크래퍼가 대역 서버를 보도록 주소 변경"""
+    import st11_scraper
+    st11_scraper.SEARCH_URL = base_url + "/Search.tmall?kwd={keyword}"
+    st11_scraper.PRODUCT_URL = base_url + "/products/{content_no}"
+
+
+def record(keyword, max_items=200, details=20):
+    """실제 11번가 검색/상세 페이지를 fixtures에 저장"""
+    from st11_scraper import ST11Scraper
+    from detail_fetcher import HttpDetailFetcher
+    
+    os.makedirs(os.path.dirname(_search_path(keyword)), exist_ok=True)
+    os.makedirs(os.path.dirname(_product_path('0')), exist_ok=True)
+    
+    scraper = ST11Scraper()
+    try:
+        products = scraper.search_products(keyword, max_items=max_items)
+        # 스크롤로 붙은 카드(data-log-body 포함)까지 들어간 DOM을 저장
+        with open(_search_path(keyword), 'w', encoding='utf-8') as f:
+            f.write(scraper.driver.page_source)
+    finally:
+        scraper.close()
+    
+    fetcher = HttpDetailFetcher()
+    try:
+        for product in products[:details]:
+            response = fetcher.session.get(product['link'], timeout=fetcher.timeout)
+            if response.ok:
+                with open(_product_path(product['content_no']), 'wb') as f:
+                    f.write(response.content)
+    finally:
+        fetcher.close()
+    
+    print(f"✅ '{keyword}' 검색 페이지 + 상세 {min(details, len(products))}개 저장: {FIXTURE_DIR}")
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else 'serve'
+    
+    if command == 'record' and len(sys.argv) > 2:
+        record(' '.join(sys.argv[2:]))
+    elif command == 'serve':
+        port = int(sys.argv[2]) if len(sys.argv) > 2 else 8765
+        server, base_url = start_replay_server(port, float(os.getenv('REPLAY_LATENCY', '0')))
+        print(f"🎞️  대역 서버 실행 중: {base_url}")
+        print(f"   ST11_SEARCH_URL='{base_url}/Search.tmall?kwd={{keyword}}'")
+        print(f"   ST11_PRODUCT_URL='{base_url}/products/{{content_no}}'")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            server.shutdown()
+    else:
+        print("사용법: python replay_server.py [serve [port] | record <키워드>]")
+
+
+if __name__ == "__main__":
+    main()
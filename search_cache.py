@@ -0,0 +1,149 @@
+import re
+import threading
+import time
+
+
+def normalize_keyword(keyword):
+    """대소문자/공백 차이를 무시한 캐시 키용 키워드"""
+    return re.sub(r'\s+', ' ', keyword.strip().lower())
+
+
+class _Flight:
+    """진행 중인 검색 하나 (같은 키로 들어온 요청들이 결과를 기다림)"""
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SearchCache:
+    """키워드+max_items 기준 검색 결과 캐시
+    
+    - ttl 안: 캐시 그대로 반환
+    - ttl~stale_ttl: 오래된 결과를 바로 반환하고 refresher로 백그라운드 갱신
+    - 그 이후/없음: 한 요청만 실제로 검색하고 같은 키의 동시 요청은 그 결과를 기다림
+    """
+    
+    def __init__(self, ttl=300, stale_ttl=1800, refresher=None, max_entries=500):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        # refresher(keyword, max_items) -> products, 백그라운드 갱신에 사용
+        self.refresher = refresher
+        self.max_entries = max_entries
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self._entries = {}
+        self._flights = {}
+        self._lock = threading.Lock()
+    
+    def get_or_fetch(self, keyword, max_items, fetch):
+        """캐시에서 결과를 꺼내거나 fetch()로 검색 (동시 요청은 하나로 합침)"""
+        products = []
+        for batch in self.iter_or_fetch(keyword, max_items, lambda: [fetch()]):
+            products.extend(batch)
+        return products
+    
+    def iter_or_fetch(self, keyword, max_items, fetch_batches):
+        """get_or_fetch와 같지만 상품 배치 단위로 yield
+        
+        캐시 적중이나 다른 요청의 검색을 기다린 경우에는 배치 하나,
+        직접 검색하는 요청(leader)은 fetch_batches()가 내는 배치를 바로 넘기고 끝나면 합쳐서 캐시에 저장한다.
+        """
+        key = (normalize_keyword(keyword), max_items)
+        now = time.time()
+        cached = None
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                age = now - entry[0]
+                if age <= self.ttl:
+                    self.hits += 1
+                    cached = entry[1]
+                elif age <= self.stale_ttl and self.refresher is not None:
+                    self.stale_hits += 1
+                    if key not in self._flights:
+                        flight = self._flights[key] = _Flight()
+                        threading.Thread(
+                            target=self._run_flight,
+                            args=(key, flight, lambda: self.refresher(keyword, max_items)),
+                            daemon=True
+                        ).start()
+                    cached = entry[1]
+            
+            if cached is None:
+                self.misses += 1
+                flight = self._flights.get(key)
+                leader = flight is None
+                if leader:
+                    flight = self._flights[key] = _Flight()
+        
+        # 락을 놓은 뒤에 yield (호출한 쪽이 배치를 처리하는 동안 다른 요청을 막지 않게)
+        if cached is not None:
+            yield self._copy(cached)
+            return
+        
+        if not leader:
+            print(f"   ⏳ '{keyword}' 진행 중인 검색 결과 대기...")
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            yield self._copy(flight.result)
+            return
+        
+        collected = []
+        try:
+            for batch in fetch_batches():
+                collected.extend(batch)
+                yield self._copy(batch)
+            flight.result = collected
+            self._store(key, collected)
+        except GeneratorExit:
+            # 호출한 쪽이 중간에 그만둔 경우: 기다리던 요청에는 모은 만큼만 주고 캐시는 하지 않음
+            flight.result = collected
+            raise
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+    
+    def _run_flight(self, key, flight, fetch):
+        """검색을 실행하고 결과를 캐시에 저장한 뒤 대기 중인 요청을 깨움"""
+        try:
+            flight.result = fetch()
+            self._store(key, flight.result)
+        except Exception as e:
+            flight.error = e
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+    
+    def _store(self, key, products):
+        """검색 결과 저장 (실패한 빈 결과는 캐시하지 않음)"""
+        if products:
+            with self._lock:
+                self._entries[key] = (time.time(), products)
+                self._evict()
+    
+    def _evict(self):
+        """max_entries를 넘으면 가장 오래된 항목부터 삭제"""
+        overflow = len(self._entries) - self.max_entries
+        if overflow <= 0:
+            return
+        oldest = sorted(self._entries, key=lambda k: self._entries[k][0])[:overflow]
+        for key in oldest:
+            del self._entries[key]
+    
+    def _copy(self, products):
+        """호출한 쪽에서 상품을 수정해도 캐시가 바뀌지 않도록 복사"""
+        return [dict(p) for p in products or []]
+    
+    def stats(self):
+        """캐시 적중/실패 횟수"""
+        return {'hits': self.hits, 'stale_hits': self.stale_hits, 'misses': self.misses}
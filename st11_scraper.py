@@ -3,15 +3,213 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
 import time
 import json
 import html as html_lib
 import re
+import queue
+import threading
+from urllib.parse import urlsplit
+from contextlib import contextmanager
+from detail_fetcher import HttpDetailFetcher
+from quantity_parser import apply_quantities, parse_quantities, volume_order
+from metrics import registry
+
+# 11번가 주소 (로컬 대역 서버로 테스트할 때 환경변수로 변경)
+SEARCH_URL = os.getenv('ST11_SEARCH_URL', 'https://search.11st.co.kr/Search.tmall?kwd={keyword}')
+PRODUCT_URL = os.getenv('ST11_PRODUCT_URL', 'https://www.11st.co.kr/products/{content_no}')
+# 검색 결과 페이지 번호 파라미터 (SEARCH_URL 뒤에 &pageNo=2 형태로 붙임)
+SEARCH_PAGE_PARAM = os.getenv('ST11_SEARCH_PAGE_PARAM', 'pageNo')
+# 브라우저를 풀에 돌려줄 때 저장소를 비울 사이트 (검색/상품 페이지 origin)
+SITE_ORIGINS = sorted({f'{url.scheme}://{url.netloc}' for url in map(urlsplit, (SEARCH_URL, PRODUCT_URL))})
+
+# 단계별 대기 시간 기본값 (초)
+DEFAULT_TIMEOUTS = {
+    'page_load': 10,   # 첫 상품 카드가 렌더링될 때까지
+    'scroll': 3,       # 스크롤 후 새 카드가 붙을 때까지
+    'detail': 5,       # 상세 페이지 meta description이 뜰 때까지
+}
+
+# 경량 모드에서 차단할 요청 (이미지, 폰트, 광고/분석 스크립트)
+DEFAULT_BLOCKED_URLS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.mp4',
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+    '*googlesyndication.com*', '*facebook.net*', '*criteo.*', '*adservice*',
+]
+
+# 현재 페이지가 받은 바이트 수와 DOMContentLoaded 시점
+PAGE_STATS_JS = """
+var nav = performance.getEntriesByType('navigation')[0];
+var bytes = nav ? (nav.transferSize || 0) : 0;
+performance.getEntriesByType('resource').forEach(function (r) { bytes += r.transferSize || 0; });
+return {bytes: bytes, ready: nav ? nav.domContentLoadedEventEnd / 1000 : null};
+"""
+
+CARD_COUNT_JS = "return document.querySelectorAll('a.c-card-item__anchor').length"
+
+# 현재 DOM을 비우고 이동 (로딩을 기다리지 않아 여러 탭이 동시에 로딩되고, 이전 페이지 카드가 남지 않음)
+NAVIGATE_JS = "document.documentElement.innerHTML = ''; window.location.href = arguments[0];"
+# 같은 방식이지만 방문 기록을 남기지 않음 (상세 페이지를 수천 개 열어도 히스토리가 쌓이지 않게)
+REPLACE_JS = "document.documentElement.innerHTML = ''; window.location.replace(arguments[0]);"
+
+# 상세 페이지 준비 여부 (meta description이 채워졌는지)
+DETAIL_READY_JS = (
+    "var m = document.querySelector(\"meta[name='description']\");"
+    "return !!(m && m.getAttribute('content'));"
+)
+
+# 검색 결과 카드를 한 번의 execute_script 호출로 추출 (arguments: 시작, 끝 인덱스)
+CARD_EXTRACT_JS = """
+var cards = Array.prototype.slice.call(document.querySelectorAll('a.c-card-item__anchor'), arguments[0], arguments[1]);
+return cards.map(function (a) {
+    var nameElem = a.querySelector('span.sr-only');
+    return {
+        log_body: a.getAttribute('data-log-body'),
+        name: nameElem ? nameElem.textContent.trim() : null
+    };
+});
+"""
+
+# 상세 페이지의 별점/리뷰/판매자 필드를 한 번에 추출
+DETAIL_EXTRACT_JS = """
+var meta = document.querySelector("meta[name='description']");
+var star = document.getElementById('prdReviewStar');
+var reviewNum = document.querySelector('strong.text_num');
+var seller = Array.prototype.map.call(document.querySelectorAll('dl.info_cont dt'), function (dt) {
+    var dd = dt.nextElementSibling;
+    while (dd && dd.tagName !== 'DD') { dd = dd.nextElementSibling; }
+    var score = dd ? dd.querySelector("em[class*='score']") : null;
+    return {
+        label: dt.textContent,
+        value: dd ? dd.innerText.trim() : null,
+        score_class: score ? score.getAttribute('class') : null
+    };
+});
+return {
+    description: meta ? meta.getAttribute('content') : null,
+    review_star: star ? star.innerText : null,
+    review_num: reviewNum ? reviewNum.innerText : null,
+    seller: seller
+};
+"""
+
+DETAIL_KEYS = ('rating', 'review_count', 'seller_satisfaction', 'seller_response', 'seller_sales')
+
+
+def apply_detail_fields(product, fields):
+    """추출한 상세 필드를 파싱해 상품에 반영"""
+    # 1. 메타 태그에서 별점/리뷰 추출
+    content = fields.get('description') or ''
+    
+    rating_match = re.search(r'평점:\s*(\d+\.?\d*)', content)
+    if rating_match:
+        rating = float(rating_match.group(1))
+        if 0 <= rating <= 5:
+            product['rating'] = rating
+    
+    review_match = re.search(r'리뷰수:\s*(\d+)', content)
+    if review_match:
+        product['review_count'] = int(review_match.group(1))
+    
+    # 2. HTML에서 별점/리뷰 추출 (백업)
+    if not product.get('rating') and fields.get('review_star'):
+        rating_match = re.search(r'(\d+\.?\d+)개', fields['review_star'])
+        if rating_match:
+            rating = float(rating_match.group(1))
+            if 0 <= rating <= 5:
+                product['rating'] = rating
+    
+    if not product.get('review_count') and fields.get('review_num'):
+        try:
+            product['review_count'] = int(fields['review_num'].strip().replace(',', ''))
+        except ValueError:
+            pass
+    
+    # 3. 판매자 정보 추출
+    for entry in fields.get('seller') or []:
+        label = entry.get('label') or ''
+        value = entry.get('value')
+        if value is None:
+            continue
+        
+        if "판매자만족" in label:
+            product['seller_satisfaction'] = value
+        elif "응답률" in label:
+            product['seller_response'] = value
+        elif "판매량" in label:
+            score_match = re.search(r'score(\d+)', entry.get('score_class') or '')
+            if score_match:
+                product['seller_sales'] = f"{score_match.group(1)}/5"
+            else:
+                product['seller_sales'] = value
+    
+    return product
+
+
+def has_detail_info(product):
+    """상세 정보가 하나라도 채워졌는지 확인"""
+    return any(product.get(key) for key in DETAIL_KEYS)
+
 
 class ST11Scraper:
-    def __init__(self, headless=True):
+    def __init__(self, headless=True, bulk_extract=True, timeouts=None, max_scrolls=10,
+                 lean=True, blocked_urls=None, page_tabs=None, max_pages=50,
+                 recycle_pages=None, max_memory_mb=None, detail_tabs=None):
+        # bulk_extract: 카드/상세 정보를 JS 한 번으로 가져옴 (False면 요소별 조회)
+        self.bulk_extract = bulk_extract
+        # timeouts: 단계별 최대 대기 시간 (DEFAULT_TIMEOUTS 키 일부만 덮어써도 됨)
+        self.timeouts = {**DEFAULT_TIMEOUTS, **(timeouts or {})}
+        self.max_scrolls = max_scrolls
+        # page_tabs: 0보다 크면 스크롤 대신 결과 페이지(pageNo)를 탭 page_tabs개로 동시에 수집
+        if page_tabs is None:
+            page_tabs = int(os.getenv('SEARCH_PAGE_TABS', '0'))
+        self.page_tabs = page_tabs
+        self.max_pages = max_pages
+        # recycle_pages / max_memory_mb: 페이지 수나 브라우저 메모리(MB)가 넘으면 드라이버 재시작 (0이면 끔)
+        if recycle_pages is None:
+            recycle_pages = int(os.getenv('DRIVER_RECYCLE_PAGES', '200'))
+        if max_memory_mb is None:
+            max_memory_mb = int(os.getenv('DRIVER_MAX_MEMORY_MB', '0'))
+        self.recycle_pages = recycle_pages
+        self.max_memory_mb = max_memory_mb
+        # detail_tabs: 브라우저 상세 수집 때 동시에 열어 둘 탭 수 (1이면 한 탭에서 하나씩)
+        if detail_tabs is None:
+            detail_tabs = int(os.getenv('DETAIL_TABS', '1'))
+        self.detail_tabs = max(1, detail_tabs)
+        # search_many에서 같은 설정의 브라우저를 추가로 띄울 때 사용
+        self._init_kwargs = {'headless': headless, 'bulk_extract': bulk_extract,
+                             'timeouts': timeouts, 'max_scrolls': max_scrolls,
+                             'lean': lean, 'blocked_urls': blocked_urls,
+                             'page_tabs': page_tabs, 'max_pages': max_pages,
+                             'recycle_pages': recycle_pages, 'max_memory_mb': max_memory_mb,
+                             'detail_tabs': detail_tabs}
+        # lean: 이미지/폰트/광고 차단 + eager 로딩 (DOM과 data-log-body만 필요)
+        self.lean = lean
+        # 추가 차단 패턴: blocked_urls 인자 또는 ST11_BLOCKED_URLS (쉼표 구분)
+        env_blocked = [u.strip() for u in os.getenv('ST11_BLOCKED_URLS', '').split(',') if u.strip()]
+        self.blocked_urls = DEFAULT_BLOCKED_URLS + env_blocked + list(blocked_urls or [])
+        self.headless = headless
+        self._start_driver()
+    
+    def _start_driver(self):
+        """Chrome 드라이버 시작 (재시작할 때도 사용)"""
+        # warm: 11번가 페이지를 한 번이라도 연 브라우저 (DNS/TLS/HTTP 캐시가 데워진 상태)
+        self.warm = False
+        # 이 드라이버로 연 페이지 수 (recycle_pages 기준)
+        self.pages_loaded = 0
         chrome_options = Options()
         
+        if self.lean:
+            chrome_options.page_load_strategy = 'eager'
+            chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+            chrome_options.add_experimental_option('prefs', {
+                'profile.managed_default_content_settings.images': 2,
+                'profile.managed_default_content_settings.fonts': 2,
+            })
+        
         # Render 환경 감지
         if os.getenv('RENDER'):
             # Render 클라우드 환경
@@ -24,69 +222,364 @@ class ST11Scraper:
             chrome_options.add_argument('--disable-extensions')
             
             service = Service('/usr/bin/chromedriver')
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            with registry.timer('scraper_driver_start_seconds'):
+                self.driver = webdriver.Chrome(service=service, options=chrome_options)
         else:
             # 로컬 환경
-            if headless:
+            if self.headless:
                 chrome_options.add_argument('--headless')
             chrome_options.add_argument('--no-sandbox')
             chrome_options.add_argument('--disable-dev-shm-usage')
             chrome_options.add_argument('--window-size=1920,1080')
             chrome_options.add_argument('user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
             
-            self.driver = webdriver.Chrome(options=chrome_options)
+            with registry.timer('scraper_driver_start_seconds'):
+                self.driver = webdriver.Chrome(options=chrome_options)
+        
+        if self.lean:
+            self._block_requests()
+    
+    def restart_driver(self, reason='manual'):
+        """브라우저를 종료하고 같은 설정으로 새로 시작 (메모리 반환)"""
+        print(f"   ♻️  브라우저 재시작 ({reason}, {self.pages_loaded}페이지 사용)")
+        registry.inc('scraper_driver_restarts_total', reason=reason)
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+        self._start_driver()
+    
+    def browser_memory_mb(self):
+        """chromedriver와 하위 Chrome 프로세스의 RSS 합계(MB), 확인할 수 없으면 None (리눅스 /proc 기준)"""
+        try:
+            root = self.driver.service.process.pid
+            children = {}
+            for name in os.listdir('/proc'):
+                if not name.isdigit():
+                    continue
+                try:
+                    with open(f'/proc/{name}/stat') as f:
+                        ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+                except (OSError, ValueError, IndexError):
+                    continue
+                children.setdefault(ppid, []).append(int(name))
+            
+            total_kb = 0
+            stack = [root]
+            while stack:
+                pid = stack.pop()
+                stack.extend(children.get(pid, []))
+                try:
+                    with open(f'/proc/{pid}/status') as f:
+                        for line in f:
+                            if line.startswith('VmRSS:'):
+                                total_kb += int(line.split()[1])
+                                break
+                except OSError:
+                    continue
+            return total_kb / 1024
+        except Exception:
+            return None
+    
+    def _recycle_reason(self):
+        """재시작이 필요하면 이유('pages' 또는 'memory'), 아니면 None"""
+        if self.recycle_pages and self.pages_loaded >= self.recycle_pages:
+            return 'pages'
+        if self.max_memory_mb:
+            memory = self.browser_memory_mb()
+            if memory is not None and memory > self.max_memory_mb:
+                print(f"   ⚠️  브라우저 메모리 {memory:.0f}MB > {self.max_memory_mb}MB")
+                return 'memory'
+        return None
+    
+    def _maybe_recycle(self):
+        """브라우저가 죽었거나 페이지 수/메모리 한도를 넘었으면 드라이버 재시작, 남은 탭은 하나만 유지"""
+        if not self.is_alive():
+            self.restart_driver('crash')
+            return
+        reason = self._recycle_reason()
+        if reason:
+            self.restart_driver(reason)
+        else:
+            self._close_extra_tabs()
+    
+    def _close_extra_tabs(self):
+        """첫 탭만 남기고 닫기 (팝업이나 중단된 탭 수집이 남긴 탭 정리)"""
+        handles = self.driver.window_handles
+        if len(handles) > 1:
+            for handle in handles[1:]:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            self.driver.switch_to.window(handles[0])
+    
+    def _open_tab(self):
+        """새 탭을 열어 전환하고 핸들 반환 (DevTools 차단 목록은 탭마다 따로 적용)"""
+        self.driver.switch_to.new_window('tab')
+        if self.lean:
+            self._block_requests()
+        return self.driver.current_window_handle
+    
+    def _block_requests(self):
+        """DevTools 네트워크 차단 목록 적용"""
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.blocked_urls})
+        except Exception as e:
+            print(f"   ⚠️  요청 차단 설정 실패: {e}")
+    
+    def _record_page_stats(self, page):
+        """페이지 전송 바이트/준비 시간을 모드(lean/full)별로 기록"""
+        self.pages_loaded += 1
+        try:
+            stats = self.driver.execute_script(PAGE_STATS_JS) or {}
+        except Exception:
+            return
+        mode = 'lean' if self.lean else 'full'
+        registry.inc('scraper_pages_total', page=page, mode=mode)
+        registry.inc('scraper_page_bytes_total', stats.get('bytes') or 0, page=page, mode=mode)
+        if stats.get('ready'):
+            registry.observe('scraper_page_ready_seconds', stats['ready'], page=page, mode=mode)
     
     def search_products(self, keyword, max_items=50):
         """11번가에서 상품 검색"""
-        search_url = f"https://search.11st.co.kr/Search.tmall?kwd={keyword}"
+        products = []
+        for batch in self.iter_products(keyword, max_items=max_items):
+            products.extend(batch)
+        
+        print(f"   ✅ {len(products)}개 상품 수집 완료")
+        return products
+    
+    def iter_products(self, keyword, max_items=50):
+        """스크롤로 새 카드가 붙을 때마다 파싱된 상품을 배치 단위로 yield
+        
+        page_tabs가 설정되어 있으면 _iter_pages로 결과 페이지를 동시에 수집한다.
+        """
+        try:
+            self._maybe_recycle()
+        except Exception as e:
+            # 브라우저를 다시 띄우지 못하면 이번 검색은 빈 결과 (다음 검색에서 다시 시도)
+            print(f"   ❌ 검색 오류: {e}")
+            registry.inc('scraper_parse_failures_total', stage='search')
+            return
+        if self.page_tabs > 0:
+            yield from self._iter_pages(keyword, max_items)
+            return
+        
+        search_url = SEARCH_URL.format(keyword=keyword)
+        started = time.perf_counter()
         
         try:
             print(f"🔍 '{keyword}' 검색 중...")
-            self.driver.get(search_url)
-            
-            print("   페이지 로딩 대기 중...")
-            time.sleep(5)
-            
-            # 페이지 맨 아래까지 스크롤
-            print("   페이지 스크롤 중...")
-            last_height = self.driver.execute_script("return document.body.scrollHeight")
+            with registry.timer('scraper_search_stage_seconds', stage='page_load'):
+                self.driver.get(search_url)
+                
+                print("   페이지 로딩 대기 중...")
+                cards_ready = self._wait_for_cards()
+            if not cards_ready:
+                print("   ⚠️  상품 카드가 로딩되지 않음")
+                return
+            self.warm = True
             
+            # 필요한 개수가 모이거나 카드가 더 늘지 않을 때까지 스크롤하며 새 카드만 파싱
+            parsed_cards = 0
+            card_count = self._count_cards()
             scroll_count = 0
-            max_scrolls = 10
             
-            while scroll_count < max_scrolls:
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
+            while True:
+                end = min(card_count, max_items)
+                if end > parsed_cards:
+                    with registry.timer('scraper_search_stage_seconds', stage='parse'):
+                        batch = self._parse_cards_range(parsed_cards, end)
+                    parsed_cards = end
+                    if batch:
+                        yield batch
                 
-                new_height = self.driver.execute_script("return document.body.scrollHeight")
+                if card_count >= max_items or scroll_count >= self.max_scrolls:
+                    break
                 
-                if new_height == last_height:
+                with registry.timer('scraper_search_stage_seconds', stage='scroll'):
+                    new_count = self._scroll_once(card_count)
+                if new_count is None:
                     print(f"   더 이상 스크롤할 내용 없음")
                     break
                 
-                last_height = new_height
+                card_count = new_count
                 scroll_count += 1
-                print(f"   스크롤 {scroll_count}회...")
-            
-            products = []
-            product_links = self.driver.find_elements(By.CSS_SELECTOR, "a.c-card-item__anchor")
+                print(f"   스크롤 {scroll_count}회... (카드 {card_count}개)")
             
-            print(f"   발견된 상품 링크: {len(product_links)}개")
+            self._record_page_stats('search')
             
-            for link_elem in product_links[:max_items]:
+        except Exception as e:
+            print(f"   ❌ 검색 오류: {e}")
+            registry.inc('scraper_parse_failures_total', stage='search')
+        finally:
+            registry.observe('scraper_search_seconds', time.perf_counter() - started)
+    
+    def _iter_pages(self, keyword, max_items=50):
+        """결과 페이지 1, 2, 3...을 탭 page_tabs개에서 동시에 열고 페이지 순서대로 배치 yield
+        
+        가장 앞 페이지의 탭을 기다리는 동안 나머지 탭도 로딩되며, 수확한 탭은 다음 페이지에 재사용한다.
+        고유 content_no가 max_items개 모이거나 새 상품이 없는 페이지가 나오면 멈춘다.
+        """
+        base_url = SEARCH_URL.format(keyword=keyword)
+        started = time.perf_counter()
+        main_handle = self.driver.current_window_handle
+        free_handles = [main_handle]
+        loading = []          # (페이지 번호, 탭) - 페이지 순서
+        next_page = 1
+        last_page = self.max_pages
+        seen = set()
+        collected = 0
+        
+        try:
+            print(f"🔍 '{keyword}' 검색 중... (페이지 {self.page_tabs}개 동시)")
+            while collected < max_items:
+                # 빈 탭마다 다음 페이지 로딩 시작 (탭이 모자라면 새로 열기)
+                while next_page <= last_page and len(loading) < self.page_tabs:
+                    if free_handles:
+                        handle = free_handles.pop()
+                        self.driver.switch_to.window(handle)
+                    else:
+                        handle = self._open_tab()
+                    self.driver.execute_script(NAVIGATE_JS, f"{base_url}&{SEARCH_PAGE_PARAM}={next_page}")
+                    loading.append((next_page, handle))
+                    next_page += 1
+                
+                if not loading:
+                    break
+                
+                page, handle = loading.pop(0)
+                self.driver.switch_to.window(handle)
+                free_handles.append(handle)
+                if page > last_page:
+                    continue
+                
+                with registry.timer('scraper_search_stage_seconds', stage='page_load'):
+                    card_count = self._settled_card_count() if self._wait_for_cards() else 0
+                if card_count == 0:
+                    last_page = page - 1
+                    continue
+                self.warm = True
+                self._record_page_stats('search')
+                
+                with registry.timer('scraper_search_stage_seconds', stage='parse'):
+                    products = self._parse_cards_range(0, card_count)
+                batch = []
+                for product in products:
+                    key = product.get('content_no') or product['link']
+                    if key not in seen:
+                        seen.add(key)
+                        batch.append(product)
+                batch = batch[:max_items - collected]
+                print(f"   페이지 {page}: 새 상품 {len(batch)}개")
+                
+                if not batch:
+                    # 마지막 페이지를 넘기면 같은 결과가 반복될 수 있음
+                    last_page = page
+                    continue
+                collected += len(batch)
+                yield batch
+        
+        except Exception as e:
+            print(f"   ❌ 검색 오류: {e}")
+            registry.inc('scraper_parse_failures_total', stage='search')
+        finally:
+            registry.observe('scraper_search_seconds', time.perf_counter() - started)
+            # 추가로 연 탭을 닫고 원래 탭으로 복귀
+            try:
+                for handle in self.driver.window_handles:
+                    if handle != main_handle:
+                        self.driver.switch_to.window(handle)
+                        self.driver.close()
+                self.driver.switch_to.window(main_handle)
+            except Exception:
+                pass
+    
+    def _parse_cards_range(self, start, end):
+        """start~end 번째 카드를 파싱해 상품 배치 생성"""
+        products = []
+        
+        if self.bulk_extract:
+            for card in self._extract_cards(start, end):
+                product = self._parse_card(card.get('log_body'), card.get('name'))
+                if product:
+                    products.append(product)
+        else:
+            product_links = self.driver.find_elements(By.CSS_SELECTOR, "a.c-card-item__anchor")
+            for link_elem in product_links[start:end]:
                 try:
                     product = self._parse_product_link(link_elem)
                     if product:
                         products.append(product)
                 except:
+                    registry.inc('scraper_parse_failures_total', stage='link')
                     continue
-            
-            print(f"   ✅ {len(products)}개 상품 수집 완료")
-            return products
-            
-        except Exception as e:
-            print(f"   ❌ 검색 오류: {e}")
-            return []
+        
+        return apply_quantities(products)
+    
+    def search_many(self, keywords, max_items=50, workers=2, progress_callback=None, pool=None, cache=None,
+                    batch_callback=None):
+        """여러 키워드를 여러 브라우저에서 병렬 검색 후 합치고 중복 제거 (self가 워커 하나를 맡음)
+        
+        자세한 동작은 모듈 함수 search_many 참고
+        """
+        return search_many(keywords, max_items=max_items, workers=workers, progress_callback=progress_callback,
+                           pool=pool, cache=cache, batch_callback=batch_callback,
+                           scraper=self, scraper_kwargs=self._init_kwargs)
+    
+    def _count_cards(self):
+        """현재 DOM에 있는 상품 카드 개수"""
+        return self.driver.execute_script(CARD_COUNT_JS) or 0
+    
+    def _wait_for_cards(self):
+        """첫 상품 카드가 렌더링될 때까지 대기"""
+        try:
+            WebDriverWait(self.driver, self.timeouts['page_load'], poll_frequency=0.2).until(
+                lambda d: self._count_cards() > 0
+            )
+            return True
+        except TimeoutException:
+            return False
+    
+    def _settled_card_count(self):
+        """카드 개수가 더 늘지 않을 때까지 잠깐 기다린 뒤 개수 반환 (스크롤 없이)"""
+        card_count = self._count_cards()
+        deadline = time.monotonic() + self.timeouts['scroll']
+        while time.monotonic() < deadline:
+            time.sleep(0.3)
+            new_count = self._count_cards()
+            if new_count == card_count:
+                break
+            card_count = new_count
+        return card_count
+    
+    def _scroll_once(self, card_count):
+        """한 번 스크롤 후 카드가 늘어나면 새 개수, 안 늘면 None"""
+        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        
+        try:
+            WebDriverWait(self.driver, self.timeouts['scroll'], poll_frequency=0.2).until(
+                lambda d: self._count_cards() > card_count
+            )
+        except TimeoutException:
+            return None
+        
+        return self._count_cards()
+    
+    def _wait_for_detail(self):
+        """상세 페이지 meta description이 채워질 때까지 대기"""
+        try:
+            WebDriverWait(self.driver, self.timeouts['detail'], poll_frequency=0.2).until(
+                lambda d: d.execute_script(DETAIL_READY_JS)
+            )
+            return True
+        except TimeoutException:
+            return False
+    
+    def _extract_cards(self, start, end):
+        """start~end 번째 카드의 data-log-body와 상품명을 한 번에 추출"""
+        cards = self.driver.execute_script(CARD_EXTRACT_JS, start, end)
+        return cards or []
     
     def _parse_product_link(self, link_elem):
         """a 태그에서 상품 정보 추출"""
@@ -95,6 +588,26 @@ class ST11Scraper:
             if not log_body:
                 return None
             
+            try:
+                name_elem = link_elem.find_element(By.CSS_SELECTOR, "span.sr-only")
+                name = name_elem.text.strip()
+            except:
+                registry.inc('scraper_parse_failures_total', stage='name')
+                name = None
+            
+            return self._parse_card(log_body, name)
+            
+        except:
+            registry.inc('scraper_parse_failures_total', stage='link')
+            return None
+    
+    @staticmethod
+    def _parse_card(log_body, name=None):
+        """data-log-body JSON과 상품명으로 상품 정보 생성"""
+        try:
+            if not log_body:
+                return None
+            
             log_body = html_lib.unescape(log_body)
             data = json.loads(log_body)
             
@@ -102,34 +615,33 @@ class ST11Scraper:
             if not content_no:
                 return None
             
-            product_url = f"https://www.11st.co.kr/products/{content_no}"
+            product_url = PRODUCT_URL.format(content_no=content_no)
             
             price = int(data.get('last_discount_price', 0))
             if price == 0:
                 return None
             
-            try:
-                name_elem = link_elem.find_element(By.CSS_SELECTOR, "span.sr-only")
-                name = name_elem.text.strip()
-            except:
-                snippet = data.get('snippet_object', {})
+            snippet = data.get('snippet_object', {})
+            
+            if name is None:
                 name = snippet.get('advert', '') or snippet.get('11talk', '') or f"상품번호 {content_no}"
             
             if not name or len(name) < 2:
                 return None
             
-            snippet = data.get('snippet_object', {})
             delivery = snippet.get('delivery_price', '배송비 확인필요')
             is_ad = data.get('ad_yn', 'N') == 'Y'
             
-            quantity = self._extract_quantity(name)
-            unit_price = price / quantity if quantity > 1 else price
-            
             return {
+                'content_no': str(content_no),
                 'name': name,
                 'price': price,
-                'unit_price': unit_price,
-                'quantity': quantity,
+                # 개수/단위 가격은 search_products에서 apply_quantities로 일괄 계산
+                'unit_price': price,
+                'quantity': 1,
+                'unit_amount': None,
+                'unit_type': None,
+                'price_per_100': None,
                 'link': product_url,
                 'delivery': delivery,
                 'is_ad': is_ad,
@@ -141,133 +653,268 @@ class ST11Scraper:
             }
             
         except:
+            registry.inc('scraper_parse_failures_total', stage='card')
             return None
     
     def _extract_quantity(self, name):
         """상품명에서 묶음 개수 추출"""
-        name_lower = name.lower()
+        return parse_quantities([name])[0]['count']
+    
+    def fetch_product_details(self, products, max_count=20, use_http=True, http_concurrency=8, cache=None):
+        """상품 상세 페이지에서 별점, 리뷰, 판매자 정보 가져오기
+        
+        use_http=True면 먼저 HTTP로 동시에 가져오고, 정보가 안 나온 페이지만 브라우저로 다시 연다.
+        cache(DetailCache)가 있으면 신선한 캐시가 있는 상품은 페이지를 열지 않는다.
+        """
+        print(f"\n⭐ 상위 {max_count}개 상품의 상세 정보 수집 중...")
+        targets = products[:max_count]
         
-        patterns = [
-            r'(\d+)개', r'(\d+)입', r'(\d+)팩', r'(\d+)박스',
-            r'(\d+)묶음', r'(\d+)병', r'(\d+)캔', r'(\d+)ea',
-            r'(\d+)p', r'x\s*(\d+)',
+        if cache is not None:
+            targets = [p for p in targets if not cache.is_complete(cache.fill(p))]
+            cached = min(max_count, len(products)) - len(targets)
+            print(f"   캐시 적중: {cached}개, 수집 필요: {len(targets)}개")
+        
+        # 새로 가져온 필드는 따로 모음 (캐시에서 채운 필드와 섞이면 브라우저 재시도/캐시 저장 판단이 틀어짐)
+        fetched = [
+            {'content_no': p.get('content_no'), 'name': p['name'], 'link': p['link']}
+            for p in targets
         ]
+        pending = fetched
         
-        for pattern in patterns:
-            match = re.search(pattern, name_lower)
-            if match:
-                try:
-                    quantity = int(match.group(1))
-                    if 1 < quantity < 1000:
-                        return quantity
-                except:
-                    pass
+        if use_http and pending:
+            fetcher = HttpDetailFetcher(concurrency=http_concurrency)
+            try:
+                fields_list = fetcher.fetch_many([p['link'] for p in pending])
+            finally:
+                fetcher.close()
+            
+            needs_browser = []
+            for detail, fields in zip(pending, fields_list):
+                if fields:
+                    apply_detail_fields(detail, fields)
+                if not has_detail_info(detail):
+                    needs_browser.append(detail)
+            
+            print(f"   HTTP 수집: {len(pending) - len(needs_browser)}/{len(pending)}개 성공")
+            pending = needs_browser
         
-        return 1
+        if pending:
+            self._fetch_details_with_browser(pending)
+        
+        for product, detail in zip(targets, fetched):
+            for key in DETAIL_KEYS:
+                if detail.get(key) is not None:
+                    product[key] = detail[key]
+            # 페이지에서 정보를 하나도 못 얻은 상품은 실패로 보고 캐시하지 않음 (다음 검색에서 재시도)
+            if cache is not None and has_detail_info(detail):
+                cache.store(detail)
+        
+        print(f"   ✅ 상세 정보 수집 완료\n")
+        return products
     
-    def fetch_product_details(self, products, max_count=20):
-        """상품 상세 페이지에서 별점, 리뷰, 판매자 정보 가져오기"""
-        print(f"\n⭐ 상위 {max_count}개 상품의 상세 정보 수집 중...")
+    def _fetch_details_with_browser(self, products):
+        """브라우저로 상세 페이지를 하나씩 열어 정보 수집 (JS가 필요한 페이지용)
+        
+        한 탭에서 방문 기록 없이(location.replace) 페이지를 바꾸고, recycle_pages/max_memory_mb를
+        넘으면 상품 사이에서 드라이버를 재시작한다. 브라우저가 죽으면 재시작 후 그 상품부터 이어서 수집한다.
+        detail_tabs가 2 이상이면 _fetch_details_with_tabs로 여러 탭에서 동시에 연다.
+        """
+        if self.detail_tabs > 1 and len(products) > 1:
+            return self._fetch_details_with_tabs(products)
         
-        for idx, product in enumerate(products[:max_count], 1):
+        total = len(products)
+        
+        for idx, product in enumerate(products, 1):
             try:
-                print(f"   {idx}/{max_count}: {product['name'][:40]}...")
-                
-                self.driver.get(product['link'])
-                time.sleep(2)
+                print(f"   {idx}/{total}: {product['name'][:40]}...")
+                self._maybe_recycle()
                 
-                # 1. 메타 태그에서 별점/리뷰 추출
                 try:
-                    meta_desc = self.driver.find_element(By.XPATH, "//meta[@name='description']")
-                    content = meta_desc.get_attribute('content')
+                    fields = self._load_detail_fields(product['link'])
+                except Exception:
+                    if self.is_alive():
+                        raise
+                    self.restart_driver('crash')
+                    fields = self._load_detail_fields(product['link'])
+                self._record_page_stats('detail')
+                apply_detail_fields(product, fields)
+                self._print_detail_info(product)
                     
-                    rating_match = re.search(r'평점:\s*(\d+\.?\d*)', content)
-                    if rating_match:
-                        rating = float(rating_match.group(1))
-                        if 0 <= rating <= 5:
-                            product['rating'] = rating
-                    
-                    review_match = re.search(r'리뷰수:\s*(\d+)', content)
-                    if review_match:
-                        product['review_count'] = int(review_match.group(1))
-                except:
-                    pass
+            except Exception as e:
+                print(f"      ⚠️  오류: {str(e)[:50]}")
+                registry.inc('scraper_detail_failures_total', mode='browser')
+                continue
+        
+        return products
+    
+    def _fetch_details_with_tabs(self, products):
+        """상세 페이지를 detail_tabs개 탭에서 동시에 열고, 준비된 탭부터 수확해 다음 상품에 재사용
+        
+        브라우저 프로세스는 하나라서 메모리는 그대로 두고 네트워크 대기만 겹친다.
+        재시작이 필요하면 새 상품 배정을 멈추고 열린 탭을 모두 수확한 뒤 재시작한다.
+        브라우저가 죽으면 로딩 중이던 상품을 한 번씩 다시 시도한다.
+        """
+        total = len(products)
+        pending = list(products)
+        retried = set()
+        loading = {}          # 탭 → (상품, 시작 시각)
+        done = 0
+        
+        try:
+            self._maybe_recycle()
+            free_handles = [self.driver.current_window_handle]
+        except Exception as e:
+            print(f"      ⚠️  오류: {str(e)[:50]}")
+            registry.inc('scraper_detail_failures_total', mode='browser')
+            return products
+        print(f"   탭 {self.detail_tabs}개로 동시 수집")
+        
+        while pending or loading:
+            try:
+                # 빈 탭마다 다음 상품 로딩 시작 (탭이 모자라면 새로 열기)
+                reason = self._recycle_reason() if pending and len(loading) < self.detail_tabs else None
+                while pending and not reason and len(loading) < self.detail_tabs:
+                    if free_handles:
+                        handle = free_handles.pop()
+                        self.driver.switch_to.window(handle)
+                    else:
+                        handle = self._open_tab()
+                    product = pending.pop(0)
+                    self.driver.execute_script(REPLACE_JS, product['link'])
+                    loading[handle] = (product, time.perf_counter())
                 
-                # 2. HTML에서 별점/리뷰 추출 (백업)
-                if not product.get('rating'):
-                    try:
-                        rating_elem = self.driver.find_element(By.ID, "prdReviewStar")
-                        rating_text = rating_elem.text
-                        rating_match = re.search(r'(\d+\.?\d+)개', rating_text)
-                        if rating_match:
-                            rating = float(rating_match.group(1))
-                            if 0 <= rating <= 5:
-                                product['rating'] = rating
-                    except:
-                        pass
+                if not loading:
+                    self._close_extra_tabs()
+                    self.restart_driver(reason)
+                    free_handles = [self.driver.current_window_handle]
+                    continue
                 
-                if not product.get('review_count'):
+                # 준비됐거나 시간이 다 된 탭 수확
+                harvested = False
+                for handle, (product, started) in list(loading.items()):
+                    self.driver.switch_to.window(handle)
+                    timed_out = time.perf_counter() - started > self.timeouts['detail']
+                    if not timed_out and not self.driver.execute_script(DETAIL_READY_JS):
+                        continue
+                    
+                    del loading[handle]
+                    free_handles.append(handle)
+                    harvested = True
+                    done += 1
+                    print(f"   {done}/{total}: {product['name'][:40]}...")
                     try:
-                        review_elem = self.driver.find_element(By.CSS_SELECTOR, "strong.text_num")
-                        review_text = review_elem.text.strip().replace(',', '')
-                        product['review_count'] = int(review_text)
-                    except:
-                        pass
-                
-                # 3. 판매자 정보 추출
-                try:
-                    seller_info = self.driver.find_elements(By.CSS_SELECTOR, "dl.info_cont dt")
-                    for dt in seller_info:
-                        if "판매자만족" in dt.text:
-                            dd = dt.find_element(By.XPATH, "./following-sibling::dd")
-                            product['seller_satisfaction'] = dd.text.strip()
-                        elif "응답률" in dt.text:
-                            dd = dt.find_element(By.XPATH, "./following-sibling::dd")
-                            product['seller_response'] = dd.text.strip()
-                        elif "판매량" in dt.text:
-                            dd = dt.find_element(By.XPATH, "./following-sibling::dd")
-                            try:
-                                score_elem = dd.find_element(By.CSS_SELECTOR, "em[class*='score']")
-                                score_class = score_elem.get_attribute('class')
-                                score_match = re.search(r'score(\d+)', score_class)
-                                if score_match:
-                                    product['seller_sales'] = f"{score_match.group(1)}/5"
-                            except:
-                                product['seller_sales'] = dd.text.strip()
-                except:
-                    pass
-                
-                # 결과 출력
-                info_parts = []
-                if product.get('rating'):
-                    info_parts.append(f"별점: {product['rating']}")
-                if product.get('review_count'):
-                    info_parts.append(f"리뷰: {product['review_count']}개")
-                if product.get('seller_satisfaction'):
-                    info_parts.append(f"만족: {product['seller_satisfaction']}")
-                if product.get('seller_response'):
-                    info_parts.append(f"응답: {product['seller_response']}")
-                if product.get('seller_sales'):
-                    info_parts.append(f"판매: {product['seller_sales']}")
+                        if self.bulk_extract:
+                            fields = self.driver.execute_script(DETAIL_EXTRACT_JS) or {}
+                        else:
+                            fields = self._collect_detail_fields()
+                    except Exception as e:
+                        print(f"      ⚠️  오류: {str(e)[:50]}")
+                        registry.inc('scraper_detail_failures_total', mode='browser')
+                        continue
+                    registry.observe('scraper_detail_seconds', time.perf_counter() - started, mode='browser')
+                    self._record_page_stats('detail')
+                    apply_detail_fields(product, fields)
+                    self._print_detail_info(product)
                 
-                if info_parts:
-                    print(f"      ✅ {', '.join(info_parts)}")
-                else:
-                    print(f"      ⚠️  상세 정보 없음")
-                    
+                if not harvested:
+                    time.sleep(0.1)
+            
             except Exception as e:
                 print(f"      ⚠️  오류: {str(e)[:50]}")
-                continue
+                registry.inc('scraper_detail_failures_total', mode='browser')
+                in_flight = [product for product, _ in loading.values()]
+                loading.clear()
+                if self.is_alive():
+                    # 어느 탭이 문제인지 모르니 탭을 정리하고 로딩 중이던 상품은 한 번만 다시 시도
+                    self._close_extra_tabs()
+                else:
+                    self.restart_driver('crash')
+                free_handles = [self.driver.current_window_handle]
+                retry = [p for p in in_flight if id(p) not in retried]
+                retried.update(id(p) for p in retry)
+                done += len(in_flight) - len(retry)
+                pending = retry + pending
         
-        print(f"   ✅ 상세 정보 수집 완료\n")
+        self._close_extra_tabs()
         return products
     
-    def sort_by_price(self, products, ascending=True, by_unit=False):
-        """가격순 정렬"""
+    def _print_detail_info(self, product):
+        """수집한 상세 정보 한 줄 출력"""
+        info_parts = []
+        if product.get('rating'):
+            info_parts.append(f"별점: {product['rating']}")
+        if product.get('review_count'):
+            info_parts.append(f"리뷰: {product['review_count']}개")
+        if product.get('seller_satisfaction'):
+            info_parts.append(f"만족: {product['seller_satisfaction']}")
+        if product.get('seller_response'):
+            info_parts.append(f"응답: {product['seller_response']}")
+        if product.get('seller_sales'):
+            info_parts.append(f"판매: {product['seller_sales']}")
+        
+        if info_parts:
+            print(f"      ✅ {', '.join(info_parts)}")
+        else:
+            print(f"      ⚠️  상세 정보 없음")
+    
+    def _load_detail_fields(self, url):
+        """현재 탭을 상세 페이지로 바꾸고 필드 수집"""
+        with registry.timer('scraper_detail_seconds', mode='browser'):
+            self.driver.execute_script(REPLACE_JS, url)
+            self._wait_for_detail()
+            
+            if self.bulk_extract:
+                return self.driver.execute_script(DETAIL_EXTRACT_JS) or {}
+            return self._collect_detail_fields()
+    
+    def _collect_detail_fields(self):
+        """요소별 조회로 상세 페이지 필드 수집 (bulk_extract=False)"""
+        fields = {'description': None, 'review_star': None, 'review_num': None, 'seller': []}
+        
+        try:
+            meta_desc = self.driver.find_element(By.XPATH, "//meta[@name='description']")
+            fields['description'] = meta_desc.get_attribute('content')
+        except:
+            pass
+        
+        try:
+            fields['review_star'] = self.driver.find_element(By.ID, "prdReviewStar").text
+        except:
+            pass
+        
+        try:
+            fields['review_num'] = self.driver.find_element(By.CSS_SELECTOR, "strong.text_num").text
+        except:
+            pass
+        
+        try:
+            for dt in self.driver.find_elements(By.CSS_SELECTOR, "dl.info_cont dt"):
+                entry = {'label': dt.text, 'value': None, 'score_class': None}
+                try:
+                    dd = dt.find_element(By.XPATH, "./following-sibling::dd")
+                    entry['value'] = dd.text.strip()
+                    score_elem = dd.find_element(By.CSS_SELECTOR, "em[class*='score']")
+                    entry['score_class'] = score_elem.get_attribute('class')
+                except:
+                    pass
+                fields['seller'].append(entry)
+        except:
+            pass
+        
+        return fields
+    
+    @staticmethod
+    def sort_by_price(products, ascending=True, by_unit=False, by_volume=False):
+        """가격순 정렬 (by_volume=True면 단위별 100ml/100g/100매당 가격, 용량을 모르는 상품은 맨 뒤)"""
+        if by_volume:
+            order = volume_order([p.get('price_per_100') for p in products],
+                                 [p.get('unit_type') for p in products], ascending)
+            return [products[i] for i in order]
         sort_key = 'unit_price' if by_unit else 'price'
         return sorted(products, key=lambda x: x[sort_key], reverse=not ascending)
     
-    def format_product_info(self, product, index):
+    @staticmethod
+    def format_product_info(product, index):
         """상품 정보 포맷팅"""
         ad_mark = "🔴광고" if product.get('is_ad') else ""
         
@@ -276,6 +923,9 @@ class ST11Scraper:
         else:
             price_info = f"💰 {product['price']:,}원"
         
+        if product.get('price_per_100') is not None:
+            price_info += f"\n📏 100{product['unit_type']}당 약 {int(product['price_per_100']):,}원"
+        
         rating_info = ""
         if product.get('rating') is not None:
             stars = "⭐" * int(product['rating'])
@@ -284,6 +934,9 @@ class ST11Scraper:
         if product.get('review_count') is not None:
             rating_info += f"\n💬 리뷰: {product['review_count']:,}개"
         
+        if (product.get('offer_count') or 1) > 1:
+            price_info += f"\n🏪 판매처 {product['offer_count']}곳 중 최저가"
+        
         seller_info = ""
         if product.get('seller_satisfaction'):
             seller_info += f"\n👍 판매자 만족: {product['seller_satisfaction']}"
@@ -299,6 +952,178 @@ class ST11Scraper:
 🔗 {product['link']}
 """
     
+    def warm_up(self):
+        """검색 페이지를 한 번 열어 연결/캐시를 미리 데움 (실패해도 무시)"""
+        try:
+            with registry.timer('scraper_warm_up_seconds'):
+                self.driver.get(SEARCH_URL.format(keyword=''))
+            self.warm = True
+        except Exception as e:
+            print(f"   ⚠️  브라우저 예열 실패: {e}")
+    
+    def is_alive(self):
+        """브라우저가 응답하는지 확인"""
+        try:
+            return self.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+    
+    def reset_state(self):
+        """다음 사용자를 위해 쿠키/스토리지 초기화
+        
+        delete_all_cookies()와 localStorage.clear()는 현재 페이지 origin에만 적용되므로
+        DevTools로 브라우저 전체 쿠키와 사이트별 저장소를 지운다 (HTTP 캐시는 예열 효과를 위해 유지).
+        """
+        try:
+            # sessionStorage는 탭마다 따로라 DevTools로 지울 수 없음: 남은 탭은 닫고 현재 탭은 직접 비움
+            self._close_extra_tabs()
+            self.driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        except Exception:
+            pass
+        try:
+            self.driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+            for origin in SITE_ORIGINS:
+                self.driver.execute_cdp_cmd('Storage.clearDataForOrigin', {
+                    'origin': origin,
+                    'storageTypes': 'cookies,local_storage,indexeddb,websql,service_workers,cache_storage',
+                })
+        except Exception:
+            # DevTools를 쓸 수 없는 드라이버는 현재 origin 쿠키만이라도 삭제
+            self.driver.delete_all_cookies()
+        self.driver.get("about:blank")
+    
     def close(self):
         """브라우저 종료"""
-        self.driver.quit()
\ No newline at end of file
+        self.driver.quit()
+
+
+def search_many(keywords, max_items=50, workers=2, progress_callback=None, pool=None, cache=None,
+                batch_callback=None, scraper=None, scraper_kwargs=None, error_callback=None):
+    """여러 키워드를 여러 브라우저에서 병렬 검색 후 합치고 중복 제거
+    
+    브라우저는 실제로 검색할 때만 쓴다: cache(SearchCache)가 있으면 캐시 적중이나
+    같은 키워드의 진행 중인 검색을 먼저 확인하고, 직접 검색하는 요청(leader)만 브라우저를 빌린다.
+    scraper가 있으면 워커 하나가 그 브라우저를 쓰고, 나머지 워커는 pool에서 키워드마다 빌리거나
+    pool이 없으면 scraper_kwargs 설정으로 처음 검색할 때 새 브라우저를 띄운다.
+    progress_callback(완료 수, 전체 수, 키워드, 수집 개수)와
+    batch_callback(키워드, 처음 보는 상품 배치)는 호출한 스레드에서 실행된다.
+    
+    키워드 하나가 실패하면(브라우저 대여 시간 초과, 브라우저 실행 실패 등) 그 키워드는 빈 결과로 두고
+    error_callback(키워드, 예외)을 호출한 뒤 나머지 키워드를 계속 검색한다.
+    모든 키워드가 실패하면 첫 예외를 그대로 올린다.
+    """
+    keywords = list(keywords)
+    if not keywords:
+        return []
+    
+    workers = max(1, min(workers, len(keywords)))
+    jobs = queue.Queue()
+    for idx, keyword in enumerate(keywords):
+        jobs.put((idx, keyword))
+    events = queue.Queue()
+    results = [None] * len(keywords)
+    
+    def run_jobs(browser):
+        while True:
+            try:
+                idx, keyword = jobs.get_nowait()
+            except queue.Empty:
+                return
+            
+            def fetch_batches(keyword=keyword):
+                with browser() as leased:
+                    yield from leased.iter_products(keyword, max_items=max_items)
+            
+            if cache is not None:
+                # 캐시 적중은 배치 하나, 직접 검색하면 스크롤마다 배치가 들어옴
+                batches = cache.iter_or_fetch(keyword, max_items, fetch_batches)
+            else:
+                batches = fetch_batches()
+            products = []
+            try:
+                for batch in batches:
+                    products.extend(batch)
+                    events.put(('batch', idx, keyword, batch))
+            except Exception as e:
+                print(f"   ❌ '{keyword}' 검색 실패: {e}")
+                events.put(('error', idx, keyword, e))
+                continue
+            print(f"   ✅ '{keyword}' {len(products)}개 상품 수집 완료")
+            events.put(('done', idx, keyword, products))
+    
+    def run_worker(primary=None):
+        owned = []
+        
+        @contextmanager
+        def browser():
+            if primary is not None:
+                yield primary
+            elif pool is not None:
+                with pool.lease(timeout=120) as leased:
+                    yield leased
+            else:
+                if not owned:
+                    owned.append(ST11Scraper(**(scraper_kwargs or {})))
+                yield owned[0]
+        
+        try:
+            run_jobs(browser)
+        except Exception as e:
+            print(f"   ⚠️  검색 워커 오류: {e}")
+        finally:
+            for extra in owned:
+                extra.close()
+            events.put(None)
+    
+    threads = [threading.Thread(target=run_worker, args=(scraper,), daemon=True)]
+    threads += [threading.Thread(target=run_worker, daemon=True) for _ in range(workers - 1)]
+    for thread in threads:
+        thread.start()
+    
+    completed = 0
+    alive = len(threads)
+    streamed_links = set()
+    errors = []
+    while completed < len(keywords) and alive > 0:
+        event = events.get()
+        if event is None:
+            alive -= 1
+            continue
+        kind, idx, keyword, products = event
+        
+        if kind == 'batch':
+            if batch_callback:
+                fresh = []
+                for product in products:
+                    if product['link'] not in streamed_links:
+                        streamed_links.add(product['link'])
+                        fresh.append(product)
+                if fresh:
+                    batch_callback(keyword, fresh)
+            continue
+        
+        if kind == 'error':
+            # 실패한 키워드는 빈 결과로 완료 처리 (products 자리에 예외가 들어 있음)
+            errors.append(products)
+            if error_callback:
+                error_callback(keyword, products)
+            products = []
+        
+        results[idx] = products
+        completed += 1
+        if progress_callback:
+            progress_callback(completed, len(keywords), keyword, len(products))
+    
+    if errors and len(errors) == len(keywords):
+        raise errors[0]
+    
+    # 키워드 순서대로 합치고 링크 기준 중복 제거
+    seen_links = set()
+    merged = []
+    for products in results:
+        for product in products or []:
+            if product['link'] not in seen_links:
+                seen_links.add(product['link'])
+                merged.append(product)
+    
+    return merged
@@ -1,19 +1,122 @@
 import os
+import queue
+import threading
+import time
 from dotenv import load_dotenv
 import requests
+from requests.adapters import HTTPAdapter
+from exporters import export_bytes
+from metrics import registry
 
 load_dotenv()
 
+# 텔레그램 전송 한도: 전체 초당 30건, 같은 채팅방은 초당 1건 (짧은 버스트 허용)
+GLOBAL_RATE = 30
+GLOBAL_BURST = 30
+CHAT_RATE = 1
+CHAT_BURST = 3
+
+# 메시지 최대 길이 (텔레그램 한도 4096자보다 약간 작게)
+MESSAGE_LIMIT = 4000
+
+
+def pack_messages(header, blocks, limit=MESSAGE_LIMIT):
+    """상품 블록을 쪼개지 않고 limit 이하의 최소 메시지 수로 묶음"""
+    messages = []
+    parts = [header]
+    size = len(header)
+    
+    for block in blocks:
+        if parts and size + len(block) > limit:
+            messages.append(''.join(parts))
+            parts = []
+            size = 0
+        parts.append(block)
+        size += len(block)
+    
+    if parts:
+        messages.append(''.join(parts))
+    return messages
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지는 토큰 버킷"""
+    
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self):
+        """토큰 하나를 예약하고 기다려야 할 시간(초)을 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0
+            return -self.tokens / self.rate
+    
+    def pause(self, seconds):
+        """429 retry_after 동안 토큰 지급 중단"""
+        with self._lock:
+            self.tokens = min(self.tokens, 0) + 1 - seconds * self.rate
+
+
 class TelegramBot:
-    def __init__(self):
+    _global_bucket = TokenBucket(GLOBAL_RATE, GLOBAL_BURST)
+    
+    def __init__(self, timeout=(5, 15), max_retries=3):
         self.token = os.getenv('TELEGRAM_BOT_TOKEN')
         self.chat_id = os.getenv('TELEGRAM_CHAT_ID')
         self.base_url = f"https://api.telegram.org/bot{self.token}"
+        self.timeout = timeout
+        self.max_retries = max_retries
+        
+        # 연결 재사용 세션
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+        
+        self._chat_buckets = {}
+        self._queue = queue.Queue()
+        self._worker = None
+        self._worker_lock = threading.Lock()
+    
+    def _chat_bucket(self, chat_id):
+        """채팅방별 토큰 버킷"""
+        bucket = self._chat_buckets.get(chat_id)
+        if bucket is None:
+            bucket = self._chat_buckets.setdefault(chat_id, TokenBucket(CHAT_RATE, CHAT_BURST))
+        return bucket
+    
+    def _post(self, method, chat_id, **kwargs):
+        """전송 한도를 지키며 API 호출 (429면 retry_after만큼 쉬고 재시도)"""
+        url = f"{self.base_url}/{method}"
+        chat_bucket = self._chat_bucket(chat_id)
+        
+        for attempt in range(self.max_retries + 1):
+            time.sleep(max(chat_bucket.reserve(), self._global_bucket.reserve()))
+            
+            with registry.timer('telegram_send_seconds', method=method):
+                response = self.session.post(url, timeout=self.timeout, **kwargs)
+            if response.status_code == 429 and attempt < self.max_retries:
+                registry.inc('telegram_retries_total')
+                try:
+                    retry_after = response.json().get('parameters', {}).get('retry_after', 1)
+                except ValueError:
+                    retry_after = 1
+                print(f"텔레그램 전송 한도 초과: {retry_after}초 후 재시도")
+                chat_bucket.pause(retry_after)
+                continue
+            
+            response.raise_for_status()
+            return response
     
     def send_message(self, text):
         """텔레그램으로 메시지 전송"""
-        url = f"{self.base_url}/sendMessage"
-        
         payload = {
             "chat_id": self.chat_id,
             "text": text,
@@ -22,19 +125,85 @@ class TelegramBot:
         }
         
         try:
-            response = requests.post(url, json=payload)
-            response.raise_for_status()
+            self._post("sendMessage", self.chat_id, json=payload)
             return True
         except requests.exceptions.RequestException as e:
             print(f"텔레그램 전송 오류: {e}")
             return False
     
+    def send_document(self, filename, content, caption=None):
+        """파일(bytes)을 문서로 전송"""
+        data = {"chat_id": self.chat_id}
+        if caption:
+            data["caption"] = caption
+            data["parse_mode"] = "HTML"
+        
+        try:
+            self._post("sendDocument", self.chat_id, data=data, files={"document": (filename, content)})
+            return True
+        except requests.exceptions.RequestException as e:
+            print(f"텔레그램 파일 전송 오류: {e}")
+            return False
+    
+    def send_results(self, header, blocks, products, max_messages=3, filename='results.csv'):
+        """검색 결과 전송: 메시지 몇 개로 충분하면 묶어서, 아니면 요약 1개 + CSV 문서로"""
+        messages = pack_messages(header, blocks)
+        
+        if len(messages) <= max_messages:
+            for message in messages:
+                self.send_async(message)
+            return len(messages)
+        
+        self.send_async(messages[0])
+        self.send_document_async(
+            filename,
+            export_bytes(products, 'csv'),
+            caption=f"📎 전체 {len(products)}개 결과"
+        )
+        return 2
+    
+    def send_async(self, text):
+        """메시지를 전송 대기열에 넣고 바로 반환 (백그라운드 스레드가 순서대로 전송)"""
+        self._enqueue(lambda: self.send_message(text))
+    
+    def send_document_async(self, filename, content, caption=None):
+        """파일을 전송 대기열에 넣고 바로 반환"""
+        self._enqueue(lambda: self.send_document(filename, content, caption))
+    
+    def _enqueue(self, job):
+        """전송 작업을 대기열에 넣고 필요하면 워커 시작"""
+        with self._worker_lock:
+            self._queue.put(job)
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run_queue, daemon=True)
+                self._worker.start()
+    
+    def _run_queue(self):
+        """대기열의 메시지를 전송 한도에 맞춰 전송 (30초간 비어 있으면 종료)"""
+        while True:
+            try:
+                job = self._queue.get(timeout=30)
+            except queue.Empty:
+                with self._worker_lock:
+                    if self._queue.empty():
+                        self._worker = None
+                        return
+                continue
+            try:
+                job()
+            finally:
+                self._queue.task_done()
+    
+    def flush(self):
+        """대기열의 메시지가 모두 전송될 때까지 대기"""
+        self._queue.join()
+    
     def get_chat_id(self):
         """봇이 받은 메시지에서 chat_id 확인"""
         url = f"{self.base_url}/getUpdates"
         
         try:
-            response = requests.get(url)
+            response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
             data = response.json()
             
@@ -47,4 +216,4 @@ class TelegramBot:
                 return None
         except Exception as e:
             print(f"오류: {e}")
-            return None
\ No newline at end of file
+            return None
@@ -0,0 +1,25 @@
+from quantity_parser import parse_quantities
+
+# (상품명, 개수, 기준 단위 용량, 단위)
+CASES = [
+    ("주방세제 1.2Lx3개", 3, 1200.0, 'ml'),
+    ("샴푸 500mlX2", 2, 500.0, 'ml'),
+    ("세제 3Lx2", 2, 3000.0, 'ml'),
+    ("세제 2.5L x 3", 3, 2500.0, 'ml'),
+    ("퐁퐁 주방세제 1.2L 3개", 3, 1200.0, 'ml'),
+    ("섬유유연제 1,000ml 2개입", 2, 1000.0, 'ml'),
+    ("물티슈 100매 x 10팩", 10, 100.0, '매'),
+    ("쌀 10kg", 1, 10000.0, 'g'),
+    ("고체 비누", 1, None, None),
+]
+
+
+def test_parse_quantities():
+    results = parse_quantities([name for name, *_ in CASES])
+    for (name, count, amount, unit), result in zip(CASES, results):
+        assert (result['count'], result['amount'], result['unit']) == (count, amount, unit), name
+
+
+if __name__ == "__main__":
+    test_parse_quantities()
+    print("ok")
@@ -0,0 +1,175 @@
+import os
+import html
+import sqlite3
+import sys
+import time
+from st11_scraper import ST11Scraper
+from telegram_bot import TelegramBot, pack_messages
+from detail_cache import DetailCache
+
+
+class WatchlistTracker:
+    """저장된 키워드를 주기적으로 검색하고 지난 결과와 비교해 변경분만 알림"""
+    
+    def __init__(self, db_path='watchlist.sqlite3'):
+        self._conn = sqlite3.connect(db_path)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS watch_keywords (
+                keyword TEXT PRIMARY KEY,
+                max_items INTEGER NOT NULL
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS snapshots (
+                keyword TEXT NOT NULL,
+                content_no TEXT NOT NULL,
+                name TEXT,
+                price INTEGER NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (keyword, content_no)
+            )
+        """)
+        self._conn.commit()
+    
+    def add(self, keyword, max_items=50):
+        """감시 키워드 추가"""
+        self._conn.execute("INSERT OR REPLACE INTO watch_keywords VALUES (?, ?)", (keyword, max_items))
+        self._conn.commit()
+    
+    def remove(self, keyword):
+        """감시 키워드와 스냅샷 삭제"""
+        self._conn.execute("DELETE FROM watch_keywords WHERE keyword = ?", (keyword,))
+        self._conn.execute("DELETE FROM snapshots WHERE keyword = ?", (keyword,))
+        self._conn.commit()
+    
+    def keywords(self):
+        """(키워드, max_items) 목록"""
+        return self._conn.execute("SELECT keyword, max_items FROM watch_keywords ORDER BY keyword").fetchall()
+    
+    def diff(self, keyword, products):
+        """지난 스냅샷과 비교해 (새 상품, 가격 변동 [(상품, 이전 가격)], 스냅샷 존재 여부) 반환"""
+        previous = dict(self._conn.execute(
+            "SELECT content_no, price FROM snapshots WHERE keyword = ?", (keyword,)
+        ).fetchall())
+        
+        new_products = []
+        price_changes = []
+        for product in products:
+            old_price = previous.get(product['content_no'])
+            if old_price is None:
+                new_products.append(product)
+            elif old_price != product['price']:
+                price_changes.append((product, old_price))
+        
+        return new_products, price_changes, bool(previous)
+    
+    def save_snapshot(self, keyword, products):
+        """이번 검색 결과로 스냅샷 갱신 (사라진 상품은 다시 나타나도 새 상품으로 알리지 않도록 유지)"""
+        now = time.time()
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?, ?, ?)",
+            [(keyword, p['content_no'], p['name'], p['price'], now) for p in products]
+        )
+        self._conn.commit()
+    
+    def run_once(self, scraper, telegram=None, detail_cache=None):
+        """모든 감시 키워드를 한 번 검색하고 변경분 알림"""
+        for keyword, max_items in self.keywords():
+            products = scraper.search_products(keyword, max_items=max_items)
+            if not products:
+                continue
+            
+            new_products, price_changes, has_snapshot = self.diff(keyword, products)
+            self.save_snapshot(keyword, products)
+            
+            if not has_snapshot:
+                print(f"   📌 '{keyword}': 기준 스냅샷 저장 ({len(products)}개)")
+                continue
+            
+            changed = new_products + [p for p, _ in price_changes]
+            print(f"   🔎 '{keyword}': 새 상품 {len(new_products)}개, 가격 변동 {len(price_changes)}개")
+            if not changed:
+                continue
+            
+            # 바뀐 상품만 상세 정보 수집
+            scraper.fetch_product_details(changed, max_count=len(changed), cache=detail_cache)
+            
+            if telegram is not None:
+                header, blocks = format_alert(keyword, new_products, price_changes)
+                for message in pack_messages(header, blocks):
+                    telegram.send_async(message)
+    
+    def run_forever(self, scraper, telegram=None, interval=3600, detail_cache=None):
+        """interval초마다 run_once 반복"""
+        while True:
+            started = time.time()
+            print(f"\n⏰ 감시 검색 시작 ({time.strftime('%Y-%m-%d %H:%M:%S')})")
+            try:
+                self.run_once(scraper, telegram, detail_cache)
+            except Exception as e:
+                print(f"   ❌ 감시 검색 오류: {e}")
+            time.sleep(max(0, interval - (time.time() - started)))
+
+
+def format_alert(keyword, new_products, price_changes):
+    """변경분 알림 메시지 (헤더, 상품별 한 줄 블록)"""
+    header = "".join([
+        f"🔔 <b>'{keyword}' 변동 알림</b>\n",
+        f"새 상품 {len(new_products)}개 · 가격 변동 {len(price_changes)}개\n\n"
+    ])
+    
+    blocks = []
+    for product, old_price in sorted(price_changes, key=lambda x: x[0]['price'] - x[1]):
+        mark = "📉" if product['price'] < old_price else "📈"
+        rate = (product['price'] - old_price) / old_price * 100
+        blocks.append(
+            f"{mark} {html.escape(product['name'][:40])}\n"
+            f"   {old_price:,}원 → {product['price']:,}원 ({rate:+.0f}%)\n"
+            f"   {product['link']}\n"
+        )
+    for product in new_products:
+        rating = f" ⭐{product['rating']:.1f}" if product.get('rating') is not None else ""
+        blocks.append(
+            f"🆕 {html.escape(product['name'][:40])}\n"
+            f"   {product['price']:,}원{rating}\n"
+            f"   {product['link']}\n"
+        )
+    return header, blocks
+
+
+def main():
+    tracker = WatchlistTracker(os.getenv('WATCHLIST_DB', 'watchlist.sqlite3'))
+    command = sys.argv[1] if len(sys.argv) > 1 else 'run'
+    keyword = ' '.join(sys.argv[2:]).strip()
+    
+    if command == 'add' and keyword:
+        tracker.add(keyword, int(os.getenv('WATCH_MAX_ITEMS', '50')))
+        print(f"✅ '{keyword}' 감시 목록에 추가")
+    elif command == 'remove' and keyword:
+        tracker.remove(keyword)
+        print(f"🗑️  '{keyword}' 감시 목록에서 삭제")
+    elif command == 'list':
+        for kw, max_items in tracker.keywords():
+            print(f"- {kw} (최대 {max_items}개)")
+    elif command == 'run':
+        if not tracker.keywords():
+            print("❌ 감시 키워드가 없습니다. python watchlist.py add <키워드>")
+            return
+        scraper = ST11Scraper()
+        try:
+            tracker.run_forever(
+                scraper,
+                TelegramBot(),
+                interval=int(os.getenv('WATCH_INTERVAL', '3600')),
+                detail_cache=DetailCache(os.getenv('DETAIL_CACHE_PATH', 'detail_cache.sqlite3'))
+            )
+        except KeyboardInterrupt:
+            print("\n⚠️  감시를 중단했습니다.")
+        finally:
+            scraper.close()
+    else:
+        print("사용법: python watchlist.py [run | list | add <키워드> | remove <키워드>]")
+
+
+if __name__ == "__main__":
+    main()